@@ -3,60 +3,56 @@ Main FastAPI application for Chief of Staff backend.
 Handles WebSocket communication and provides REST API endpoints.
 """
 import asyncio
+import functools
+import html
+import itertools
 import json
 import logging
-from utils.datetime_utils import utc_now, utc_timestamp
-from typing import Dict, Any, List, Optional
+import os
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from utils.datetime_utils import utc_now, utc_timestamp, parse_iso_datetime
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Depends, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse
-from sqlalchemy import create_engine, event
+from sqlalchemy import and_, case, create_engine, delete, event, func, insert, inspect, lambda_stmt, select, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 from pydantic import BaseModel
+import orjson
 
-from models import Base, Area, Project, Task, ContextEntry, Job, Interview, Digest
+from models import Base, Area, Project, Task, ContextEntry, Job, Interview, Digest, new_id, adjust_project_task_counts
 from job_queue import JobQueue
 from claude_client import ClaudeClient
 from agents import COSOrchestrator
+from integrations.outlook.com_connector import COMError
+from integrations.outlook.property_sync import save_selected_action_to_outlook
+from schemas.email_schema import create_email_from_com, email_to_dict
 
 # Logging setup
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Load environment variables explicitly
-import os
 from dotenv import load_dotenv
 
 # Load .env file
 env_loaded = load_dotenv()
 logger.info(f"Environment file loading: {'SUCCESS' if env_loaded else 'FAILED'}")
 
-# Debug environment variables loading
-logger.info("Environment variables check:")
-logger.info(f"  MICROSOFT_CLIENT_ID: {'SET' if os.getenv('MICROSOFT_CLIENT_ID') else 'NOT SET'}")
-logger.info(f"  MICROSOFT_CLIENT_SECRET: {'SET' if os.getenv('MICROSOFT_CLIENT_SECRET') else 'NOT SET'}")
-logger.info(f"  MICROSOFT_TENANT_ID: {os.getenv('MICROSOFT_TENANT_ID', 'NOT SET')}")
-logger.info(f"  Current working directory: {os.getcwd()}")
-logger.info(f"  .env file exists: {os.path.exists('.env')}")
-
-# Try to load .env file manually if it exists
-if os.path.exists('.env'):
-    logger.info("Found .env file, checking contents...")
-    try:
-        with open('.env', 'r') as f:
-            lines = f.readlines()
-            for i, line in enumerate(lines, 1):
-                if 'MICROSOFT_CLIENT_ID' in line and not line.strip().startswith('#'):
-                    logger.info(f"  Line {i}: {line.strip()}")
-                elif 'MICROSOFT_CLIENT_SECRET' in line and not line.strip().startswith('#'):
-                    logger.info(f"  Line {i}: MICROSOFT_CLIENT_SECRET=[REDACTED] (length: {len(line.split('=', 1)[1].strip()) if '=' in line else 0})")
-    except Exception as e:
-        logger.error(f"Error reading .env file: {e}")
-else:
-    logger.warning("No .env file found in current directory")
+# Hot-path diagnostics are INFO/DEBUG only; keep production logs to warnings and above
+if os.getenv("ENVIRONMENT") == "production":
+    logger.setLevel(logging.WARNING)
+
+# Debug environment variables loading (opt-in, load_dotenv already parsed .env)
+if os.getenv("COS_DEBUG_ENV"):
+    env_status = {k: bool(os.getenv(k)) for k in ("MICROSOFT_CLIENT_ID", "MICROSOFT_CLIENT_SECRET", "MICROSOFT_TENANT_ID")}
+    logger.info(f"Environment variables set: {env_status}")
 
 # Database setup with optimizations
 DATABASE_URL = "sqlite:///./cos.db"
@@ -68,16 +64,43 @@ engine = create_engine(
     echo=False  # Set to True for SQL debugging
 )
 
-# SQLite optimizations disabled for WSL compatibility
-# @event.listens_for(engine, "connect")
-# def set_sqlite_pragma(dbapi_connection, connection_record):
-#     cursor = dbapi_connection.cursor()
-#     cursor.execute("PRAGMA journal_mode=DELETE")
-#     cursor.execute("PRAGMA synchronous=NORMAL") 
-#     cursor.execute("PRAGMA cache_size=10000")
-#     cursor.execute("PRAGMA temp_store=MEMORY")
-#     cursor.close()
+# Pooled connections for read-only work that can run alongside the shared app connection
+read_engine = create_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    echo=False
+)
+
+# Pooled connections for WebSocket handler sessions, whose work runs in worker threads: each
+# session gets its own connection instead of sharing the StaticPool one used on the event loop
+worker_engine = create_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    echo=False
+)
+
+# SQLite's default journal mode is kept unless COS_SQLITE_JOURNAL_MODE is set (e.g. WAL, which
+# lets readers proceed while a write is in progress). Leave it unset when the database lives on
+# a Windows drive mounted into WSL, where WAL is not supported
+SQLITE_JOURNAL_MODES = {"DELETE", "WAL", "TRUNCATE", "PERSIST", "MEMORY", "OFF"}
+SQLITE_JOURNAL_MODE = os.getenv("COS_SQLITE_JOURNAL_MODE", "").upper() or None
+if SQLITE_JOURNAL_MODE is not None and SQLITE_JOURNAL_MODE not in SQLITE_JOURNAL_MODES:
+    raise ValueError(
+        f"Invalid COS_SQLITE_JOURNAL_MODE {SQLITE_JOURNAL_MODE!r}; expected one of {sorted(SQLITE_JOURNAL_MODES)}"
+    )
+
+if SQLITE_JOURNAL_MODE:
+    @event.listens_for(engine, "connect")
+    @event.listens_for(read_engine, "connect")
+    @event.listens_for(worker_engine, "connect")
+    def set_sqlite_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE}")
+        cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+WorkerSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=worker_engine)
 
 # Global instances
 job_queue = JobQueue()
@@ -87,10 +110,31 @@ cos_orchestrator = COSOrchestrator(claude_client, job_queue)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events"""
+    # Run short-lived tasks (e.g. WebSocket sends) eagerly where supported (Python 3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
     # Create database tables
     Base.metadata.create_all(bind=engine)
     logger.info("Database tables created")
     
+    # create_all skips existing tables, so add any indexes missing from older databases
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    
+    # Add the denormalized project task counters to older databases and resync them
+    project_columns = {column["name"] for column in inspect(engine).get_columns("projects")}
+    with engine.begin() as conn:
+        for column in ("task_count", "completed_task_count"):
+            if column not in project_columns:
+                conn.execute(text(f"ALTER TABLE projects ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0"))
+        conn.execute(text(
+            "UPDATE projects SET "
+            "task_count = (SELECT COUNT(*) FROM tasks WHERE tasks.project_id = projects.id), "
+            "completed_task_count = (SELECT COUNT(*) FROM tasks WHERE tasks.project_id = projects.id AND tasks.status = 'completed')"
+        ))
+    
     # Start job queue
     await job_queue.start()
     logger.info("Job queue started")
@@ -108,6 +152,13 @@ async def lifespan(app: FastAPI):
     await job_queue.stop()
     logger.info("Job queue stopped")
 
+# Prefer libuv-based event loop where available (not supported on Windows)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 app = FastAPI(title="Chief of Staff API", lifespan=lifespan)
 
 # CORS middleware
@@ -127,86 +178,146 @@ def get_db():
     finally:
         db.close()
 
+def get_worker_db():
+    """Session for a WebSocket handler, whose queries run in worker threads via WSMessageHandler._db"""
+    db = WorkerSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def encode_message(event: str, data: Any) -> str:
+    """Serialize a WebSocket message envelope (as text; both frontends expect text frames)"""
+    return orjson.dumps({"event": event, "data": data}, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+# Pre-encoded fixed-shape control messages
+ERROR_MESSAGE_TEMPLATE = encode_message("error", {"message": "__MSG__"})
+
+AI_STATUS_IDLE_CHECKED = {
+    "status": "connected",
+    "provider": "Anthropic", 
+    "model": "Claude-3.5-Sonnet",
+    "last_check": "idle_timeout_reached"
+}
+AI_STATUS_SKIPPED = {
+    "status": "connected" if claude_client and hasattr(claude_client, 'client') else "no_client",
+    "provider": "Anthropic",
+    "model": "Claude-3.5-Sonnet",
+    "check_status": "skipped_idle_timeout" if claude_client else "no_client"
+}
+OUTLOOK_STATUS_DISCONNECTED = {"status": "disconnected", "method": None}
+OUTLOOK_STATUS_AVAILABLE = {"status": "available", "method": "com"}
+
+AI_STATUS_IDLE_CHECKED_MESSAGE = encode_message("status:ai", AI_STATUS_IDLE_CHECKED)
+AI_STATUS_SKIPPED_MESSAGE = encode_message("status:ai", AI_STATUS_SKIPPED)
+OUTLOOK_STATUS_DISCONNECTED_MESSAGE = encode_message("status:outlook", OUTLOOK_STATUS_DISCONNECTED)
+OUTLOOK_STATUS_AVAILABLE_MESSAGE = encode_message("status:outlook", OUTLOOK_STATUS_AVAILABLE)
+
 # WebSocket connection manager
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: Dict[str, WebSocket] = {}
-        self.connection_metadata: Dict[str, Dict[str, Any]] = {}
+        self.active_connections: Dict[int, WebSocket] = {}
+        self.connection_metadata: Dict[int, Dict[str, Any]] = {}
 
-    async def connect(self, websocket: WebSocket) -> str:
+    async def connect(self, websocket: WebSocket) -> int:
         await websocket.accept()
-        connection_id = str(id(websocket))
+        connection_id = id(websocket)
         self.active_connections[connection_id] = websocket
         self.connection_metadata[connection_id] = {
             "connected_at": utc_now(),
             "last_ping": utc_now()
         }
-        logger.info(f"WebSocket connected: {connection_id}. Total: {len(self.active_connections)}")
+        logger.info(f"WebSocket connected: {connection_id:x}. Total: {len(self.active_connections)}")
         return connection_id
 
     def disconnect(self, websocket: WebSocket):
-        connection_id = str(id(websocket))
+        connection_id = id(websocket)
         self.active_connections.pop(connection_id, None)
         self.connection_metadata.pop(connection_id, None)
-        logger.info(f"WebSocket disconnected: {connection_id}. Total: {len(self.active_connections)}")
+        logger.info(f"WebSocket disconnected: {connection_id:x}. Total: {len(self.active_connections)}")
 
     async def send_to_all(self, event: str, data: Any):
         """Send message to all connected clients with improved error handling"""
         if not self.active_connections:
             return
             
-        message_text = json.dumps({"event": event, "data": data}, default=str)
-        disconnected_ids = []
-        
-        # Use asyncio.gather for concurrent sending
-        send_tasks = []
-        for connection_id, connection in self.active_connections.items():
-            send_tasks.append(self._send_safe(connection_id, connection, message_text))
-        
-        results = await asyncio.gather(*send_tasks, return_exceptions=True)
+        message_text = encode_message(event, data)
+        connections = list(self.active_connections.items())
         
-        # Clean up failed connections
-        for i, (connection_id, result) in enumerate(zip(self.active_connections.keys(), results)):
-            if isinstance(result, Exception):
-                disconnected_ids.append(connection_id)
+        # ws.send rarely yields, so skip gather machinery for small fan-outs
+        if len(connections) == 1:
+            connection_id, connection = connections[0]
+            results = [await self._try_send(connection_id, connection, message_text)]
+        else:
+            results = await asyncio.gather(
+                *(self._try_send(connection_id, connection, message_text) for connection_id, connection in connections),
+                return_exceptions=True
+            )
         
-        for conn_id in disconnected_ids:
-            self.active_connections.pop(conn_id, None)
-            self.connection_metadata.pop(conn_id, None)
+        # Clean up failed connections (a send that ended in an exception counts as failed)
+        for (conn_id, _), result in zip(connections, results):
+            if result is not None:
+                self.active_connections.pop(conn_id, None)
+                self.connection_metadata.pop(conn_id, None)
     
-    async def _send_safe(self, connection_id: str, connection: WebSocket, message: str):
+    async def _try_send(self, connection_id: int, connection: WebSocket, message: str) -> Optional[int]:
+        """Send to a single connection, returning its id if the send failed"""
+        try:
+            await self._send_safe(connection_id, connection, message)
+            return None
+        except Exception:
+            return connection_id
+    
+    async def _send_safe(self, connection_id: int, connection: WebSocket, message: str):
         """Safely send message to a single connection"""
         try:
             await connection.send_text(message)
         except Exception as e:
-            logger.error(f"Error sending to WebSocket {connection_id}: {e}")
+            logger.error(f"Error sending to WebSocket {connection_id:x}: {e}")
             raise
 
     async def send_to_client(self, websocket: WebSocket, event: str, data: Any):
         """Send message to specific client"""
-        message = {"event": event, "data": data}
         try:
-            await websocket.send_text(json.dumps(message, default=str))
+            await websocket.send_text(encode_message(event, data))
         except Exception as e:
             logger.error(f"Error sending to specific WebSocket: {e}")
             # Try with simplified error response
             try:
-                error_message = {"event": "error", "data": {"message": str(e)}}
-                await websocket.send_text(json.dumps(error_message, default=str))
+                await websocket.send_text(ERROR_MESSAGE_TEMPLATE.replace("__MSG__", json.dumps(str(e))[1:-1]))
             except:
                 pass  # If even error sending fails, give up gracefully
     
+    async def send_raw_to_client(self, websocket: WebSocket, message_text: str):
+        """Send an already-serialized message to a specific client"""
+        try:
+            await websocket.send_text(message_text)
+        except Exception as e:
+            logger.error(f"Error sending to specific WebSocket: {e}")
+    
+    async def send_many_to_client(self, websocket: WebSocket, messages: List[Tuple[str, Any]]):
+        """Send several messages to a client in one frame, as a JSON array of message envelopes"""
+        if len(messages) == 1:
+            await self.send_to_client(websocket, *messages[0])
+        elif messages:
+            await self.send_raw_to_client(
+                websocket,
+                orjson.dumps(
+                    [{"event": event, "data": data} for event, data in messages],
+                    default=str, option=orjson.OPT_NON_STR_KEYS
+                ).decode()
+            )
+    
     async def broadcast_to_all(self, event: str, data: Any):
         """Broadcast message to all connected clients"""
-        message = {"event": event, "data": data}
-        message_str = json.dumps(message, default=str)
+        message_str = encode_message(event, data)
         
         disconnected = []
         for connection_id, websocket in self.active_connections.items():
             try:
                 await websocket.send_text(message_str)
             except Exception as e:
-                logger.warning(f"Failed to send to connection {connection_id}: {e}")
+                logger.warning(f"Failed to send to connection {connection_id:x}: {e}")
                 disconnected.append(connection_id)
         
         # Clean up disconnected clients
@@ -216,6 +327,103 @@ class ConnectionManager:
 
 manager = ConnectionManager()
 
+class TaskStatusBatcher:
+    """Coalesces task status changes into one task:status_changes broadcast per window"""
+    
+    def __init__(self, window: float = 0.02):
+        self.window = window
+        self.pending: Dict[str, str] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+    
+    def add(self, task_id: str, status: str):
+        """Queue a status change; repeated changes to one task within a window keep the latest"""
+        self.pending[task_id] = status
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+    
+    async def _flush_after_window(self):
+        await asyncio.sleep(self.window)
+        updates, self.pending = self.pending, {}
+        self._flush_task = None
+        await manager.send_to_all(
+            "task:status_changes",
+            {"updates": [{"task_id": task_id, "status": status} for task_id, status in updates.items()]}
+        )
+
+task_status_batcher = TaskStatusBatcher()
+
+# Last serialized project:data_update message, keyed on the DB change marker
+dashboard_cache: Dict[str, Any] = {"version": None, "payload": None, "sections": None, "built_at": 0.0}
+
+# Process-wide database revision, bumped after every session commit on any engine. The dashboard
+# cache is keyed on it: SQLite's data_version/total_changes() are per connection, so with pooled
+# engines a check on one connection can't see a write committed on another
+db_revision = 0
+db_revision_lock = threading.Lock()
+
+@event.listens_for(Session, "after_commit")
+def bump_db_revision(session):
+    global db_revision
+    with db_revision_lock:
+        db_revision += 1
+# Only one dashboard rebuild runs at a time; concurrent loaders wait for it and reuse the result
+dashboard_lock = asyncio.Lock()
+DASHBOARD_CACHE_TTL = 300  # seconds; upper bound on reuse even when the change marker is unchanged
+DASHBOARD_ACTIVE_STATUSES = ('not_started', 'active')
+# Email list/selection handlers trust a successful COM probe for this long; COM errors reset it
+COM_PROBE_TTL = 30.0
+
+# Status banners shown in the COS chat when an email is selected
+NO_RECOMMENDATIONS_TEXT = "ℹ️ No recommendations available for this email. Click 'Analyze' to generate recommendations."
+NEEDS_ANALYSIS_TEXT = "ℹ️ This email hasn't been analyzed yet. Click 'Analyze' to generate recommendations."
+
+# Selected-email lookups are reused for this long, so re-clicking an email skips the COM fetch
+EMAIL_CACHE_TTL = 60
+EMAIL_CACHE_MAX = 256
+
+# Email loads up to this size go out as one WebSocket frame instead of one per batch
+EMAIL_COALESCE_LIMIT = 50
+
+# Fields sent to the frontend for each email, with their defaults (shared objects; read-only)
+EMAIL_FIELD_DEFAULTS = {
+    "id": "unknown",
+    "subject": "No Subject",
+    "sender_name": "Unknown Sender",
+    "sender_email": "",
+    "sender": "",
+    "to_recipients": [],
+    "cc_recipients": [],
+    "bcc_recipients": [],
+    "body_content": "",
+    "body_preview": "",
+    "received_at": None,
+    "is_read": False,
+    "has_attachments": False,
+    "importance": "normal",
+    "analysis": {},  # COM service includes analysis
+    "project_id": None,
+    "confidence": None,
+    "provenance": None,
+}
+EMAIL_ANALYSIS_DEFAULTS = {"priority": "MEDIUM", "tone": "PROFESSIONAL", "urgency": "MEDIUM"}
+DASHBOARD_SECTIONS = ("areas", "projects", "tasks")
+
+def dashboard_section_message(section: str, encoded: str) -> str:
+    """project:<section> message around one pre-serialized dashboard section"""
+    return f'{{"event":"project:{section}","data":{{"{section}":{encoded}}}}}'
+
+def dashboard_message(sections: Dict[str, str]) -> str:
+    """project:data_update message spliced from the pre-serialized sections"""
+    fields = ",".join(f'"{section}":{sections[section]}' for section in DASHBOARD_SECTIONS)
+    return f'{{"event":"project:data_update","data":{{{fields}}}}}'
+
+def dashboard_cache_fresh(revision: int) -> bool:
+    """Whether the cached dashboard payload was built at database revision and is within its TTL"""
+    return (
+        dashboard_cache["version"] == revision
+        and time.monotonic() - dashboard_cache["built_at"] < DASHBOARD_CACHE_TTL
+    )
+
 # Global function to broadcast usage updates
 async def broadcast_usage_update():
     """Broadcast usage statistics to all connected clients"""
@@ -228,21 +436,95 @@ async def broadcast_usage_update():
 # Set the usage callback on claude_client
 claude_client.usage_update_callback = broadcast_usage_update
 
+def chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of up to size items from one pass over items"""
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+@functools.lru_cache(maxsize=1024)
+def parse_fromisoformat(value: str) -> datetime:
+    """datetime.fromisoformat, memoized; bulk task edits tend to repeat the same dates"""
+    return datetime.fromisoformat(value)
+
+def parse_optional_datetime(value: Optional[str]) -> Optional[datetime]:
+    """ISO datetime string to datetime, passing through empty values as None"""
+    return parse_iso_datetime(value) if value else None
+
+def optional_str(value: Any) -> Optional[str]:
+    """str(value), passing through None so an update can clear the field"""
+    return None if value is None else str(value)
+
+def optional_int(value: Any) -> Optional[int]:
+    """int(value), passing through None so an update can clear the field"""
+    return None if value is None else int(value)
+
+# Task fields a task:update message may set, with the caster applied to each value
+TASK_UPDATABLE_FIELDS = {
+    "title": str,
+    "objective": optional_str,
+    "status": str,
+    "priority": optional_int,
+    "due_date": parse_optional_datetime,
+    "project_id": lambda value: value,  # an id, stored as sent
+    "sponsor_email": optional_str,
+    "owner_email": optional_str,
+}
+
+# Updatable task fields that can't be cleared with None
+TASK_REQUIRED_FIELDS = frozenset({"title", "status", "project_id"})
+
 # WebSocket message handlers
 class WSMessageHandler:
     def __init__(self, websocket: WebSocket, db: Session):
         self.websocket = websocket
         self.db = db
+        self._email_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}  # email_id -> (fetched_at, email_data)
+
+    async def _db(self, fn, *args):
+        """Run a blocking session operation in a worker thread to keep the event loop free.
+        Only for sessions on worker_engine (or read_engine), never the shared StaticPool one."""
+        return await asyncio.to_thread(fn, *args)
+
+    async def _com(self, fn, *args):
+        """Run a blocking Outlook COM call in a worker thread; the connector gives each thread its own proxy"""
+        return await asyncio.to_thread(fn, *args)
 
-    def _format_datetime(self, dt):
+    @staticmethod
+    def _status_message(id_prefix: str, text: str, **extra) -> Dict[str, Any]:
+        """System status message for the COS chat thread"""
+        return {
+            "id": f"{id_prefix}_{time.time_ns() // 1_000_000}",
+            "text": text,
+            "timestamp": utc_timestamp(),
+            "sender": "system",
+            "isStatus": True,
+            **extra
+        }
+
+    def _cached_email_data(self, email_id: str) -> Optional[Dict[str, Any]]:
+        """Return a recently fetched email dict, or None if missing or expired"""
+        entry = self._email_cache.get(email_id)
+        if entry and time.monotonic() - entry[0] < EMAIL_CACHE_TTL:
+            return entry[1]
+        self._email_cache.pop(email_id, None)
+        return None
+
+    def _cache_email_data(self, email_id: str, email_data: Dict[str, Any]):
+        if len(self._email_cache) >= EMAIL_CACHE_MAX:
+            # Dicts keep insertion order, so this drops the oldest entry
+            self._email_cache.pop(next(iter(self._email_cache)))
+        self._email_cache[email_id] = (time.monotonic(), email_data)
+
+    @staticmethod
+    def _format_datetime(dt):
         """Format datetime object to ISO string for frontend consumption"""
         if dt is None:
             return None
         try:
             # Handle both datetime objects and strings
             if isinstance(dt, str):
-                from dateutil.parser import parse
-                dt = parse(dt)
+                return WSMessageHandler._format_datetime_string(dt)
             
             if hasattr(dt, 'isoformat'):
                 return dt.isoformat()
@@ -252,30 +534,20 @@ class WSMessageHandler:
             logger.warning(f"Failed to format datetime {dt}: {e}")
             return str(dt) if dt else None
 
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _format_datetime_string(value: str) -> str:
+        # Parsing is the costly part and the same timestamps recur across reloads. datetime
+        # inputs aren't cached: equal instants in different zones would share one entry
+        return parse_iso_datetime(value).isoformat()
+
     async def handle_message(self, event: str, data: Dict[str, Any]):
         """Route WebSocket messages to appropriate handlers"""
-        handlers = {
-            "thread:send": self.handle_thread_send,
-            "email:apply_action": self.handle_email_action,
-            "interview:answer": self.handle_interview_answer,
-            "interview:dismiss": self.handle_interview_dismiss,
-            "project:create": self.handle_project_create,
-            "project:load_dashboard": self.handle_load_dashboard,
-            "project:insight_action": self.handle_insight_action,
-            "task:create": self.handle_task_create,
-            "task:update": self.handle_task_update,
-            "email:analyze": self.handle_email_analyze,
-            "email:get_recent": self.handle_get_recent_emails,
-            "email:selected": self.handle_email_selected,
-            "email_recommendation_action": self.handle_email_recommendation_action,
-            "status:request": self.handle_status_request,
-        }
-        
         logger.info(f"Received WebSocket event: {event}")
-        handler = handlers.get(event)
+        handler = self.EVENT_HANDLERS.get(event)
         if handler:
             try:
-                await handler(data)
+                await handler(self, data)
             except Exception as e:
                 logger.error(f"Error handling {event}: {e}")
                 await manager.send_to_client(
@@ -337,6 +609,7 @@ class WSMessageHandler:
         email_id = data.get("email_id")  # Changed from thread_id to email_id
         action = data.get("action")
         payload = data.get("payload")
+        self._email_cache.pop(email_id, None)
         
         if not email_id or not action:
             await manager.send_to_client(
@@ -351,15 +624,14 @@ class WSMessageHandler:
             com_service = cos_orchestrator.email_triage.com_service
             
             # Ensure COM connection
-            if not com_service.is_connected():
-                connection_result = com_service.connect()
-                if not connection_result.get('connected'):
-                    await manager.send_to_client(
-                        self.websocket,
-                        "email:action_error",
-                        {"message": f"Outlook connection failed: {connection_result.get('message', 'Unknown error')}"}
-                    )
-                    return
+            connection_result = com_service.ensure_connected()
+            if not connection_result.get('connected'):
+                await manager.send_to_client(
+                    self.websocket,
+                    "email:action_error",
+                    {"message": f"Outlook connection failed: {connection_result.get('message', 'Unknown error')}"}
+                )
+                return
             
             # Apply action based on type
             result = {"success": False, "message": "Unknown action"}
@@ -374,120 +646,16 @@ class WSMessageHandler:
                 # This would require implementing mark_read in COM service
                 result = {"success": True, "message": "Action noted (implementation pending)"}
             
-            elif action_type == "create_task":
-                # Create task from suggestion
-                try:
-                    # First try to get task_data from request (if frontend provides it)
-                    task_data = data.get("task_data", {})
-                    
-                    # If no task_data provided, extract it from the email's analysis
-                    if not task_data:
-                        logger.info(f"🔄 [EMAIL_ACTION] No task_data provided, retrieving from email analysis...")
-                        
-                        # Get email details to extract task data from analysis
-                        com_service = cos_orchestrator.email_triage.com_service
-                        logger.info(f"🔍 [EMAIL_ACTION] COM service available: {com_service is not None}")
-                        logger.info(f"🔍 [EMAIL_ACTION] COM service connected: {com_service.is_connected() if com_service else False}")
-                        
-                        if com_service and com_service.is_connected():
-                            logger.info(f"🔄 [EMAIL_ACTION] Calling get_email_details for: {email_id}")
-                            email_details = com_service.get_email_details(email_id)
-                            logger.info(f"🔍 [EMAIL_ACTION] Email details returned: {email_details is not None}")
-                            
-                            if email_details:
-                                logger.info(f"🔍 [EMAIL_ACTION] Email details keys: {list(email_details.keys())}")
-                                has_analysis = 'analysis' in email_details
-                                logger.info(f"🔍 [EMAIL_ACTION] Has analysis: {has_analysis}")
-                                
-                                if has_analysis:
-                                    analysis = email_details['analysis']
-                                    logger.info(f"🔍 [EMAIL_ACTION] Analysis type: {type(analysis)}")
-                                    logger.info(f"🔍 [EMAIL_ACTION] Analysis: {analysis}")
-                                    
-                                    if isinstance(analysis, dict):
-                                        has_suggested_actions = 'suggested_actions' in analysis
-                                        logger.info(f"🔍 [EMAIL_ACTION] Has suggested_actions: {has_suggested_actions}")
-                                        
-                                        if has_suggested_actions:
-                                            suggested_actions = analysis['suggested_actions']
-                                            logger.info(f"🔍 [EMAIL_ACTION] Suggested actions count: {len(suggested_actions) if suggested_actions else 0}")
-                                            logger.info(f"🔍 [EMAIL_ACTION] Suggested actions: {suggested_actions}")
-                                            
-                                            # Look for create_task action with embedded task_data
-                                            for i, suggested_action in enumerate(suggested_actions):
-                                                logger.info(f"🔍 [EMAIL_ACTION] Action {i}: type={suggested_action.get('type')}, has_task_data={'task_data' in suggested_action}")
-                                                if suggested_action.get('type') == 'create_task' and 'task_data' in suggested_action:
-                                                    task_data = suggested_action['task_data']
-                                                    logger.info(f"✅ [EMAIL_ACTION] Found task_data in email analysis: {task_data}")
-                                                    break
-                                        else:
-                                            logger.warning(f"⚠️ [EMAIL_ACTION] No suggested_actions in analysis")
-                                    else:
-                                        logger.warning(f"⚠️ [EMAIL_ACTION] Analysis is not a dict: {analysis}")
-                                else:
-                                    logger.warning(f"⚠️ [EMAIL_ACTION] No analysis in email details")
-                            else:
-                                logger.warning(f"⚠️ [EMAIL_ACTION] get_email_details returned None")
-                        else:
-                            logger.warning(f"⚠️ [EMAIL_ACTION] COM service not available or not connected")
-                    
-                    if not task_data:
-                        logger.warning(f"⚠️ [EMAIL_ACTION] No task data available for email: {email_id}")
-                        result = {"success": False, "message": "No task data available - please analyze the email first"}
-                    else:
-                        from models import Task, new_id, utc_now
-                        from datetime import datetime
-                        
-                        # Create new task in database
-                        new_task_id = new_id()
-                        logger.info(f"🔄 [TASK_CREATE] Creating task with ID: {new_task_id}")
-                        logger.info(f"🔄 [TASK_CREATE] Title: {task_data.get('title', 'Untitled Task')}")
-                        logger.info(f"🔄 [TASK_CREATE] Project ID: {task_data.get('project_id')}")
-                        logger.info(f"🔄 [TASK_CREATE] Objective: {task_data.get('objective', '')}")
-                        logger.info(f"🔄 [TASK_CREATE] Priority: {task_data.get('priority', 3)}")
-                        logger.info(f"🔄 [TASK_CREATE] Sponsor: {task_data.get('sponsor_email', '')}")
-                        logger.info(f"🔄 [TASK_CREATE] Owner: {task_data.get('owner_email', '')}")
-                        
-                        new_task = Task(
-                            id=new_task_id,
-                            title=task_data.get('title', 'Untitled Task'),
-                            objective=task_data.get('objective', ''),
-                            status='not_started',
-                            priority=task_data.get('priority', 3),
-                            sponsor_email=task_data.get('sponsor_email', ''),
-                            owner_email=task_data.get('owner_email', ''),
-                            project_id=task_data.get('project_id'),
-                            created_at=utc_now()
-                        )
-                        
-                        # Parse due_date if provided
-                        if task_data.get('due_date'):
-                            try:
-                                new_task.due_date = datetime.fromisoformat(task_data['due_date'].replace('Z', '+00:00'))
-                            except (ValueError, AttributeError):
-                                logger.warning(f"⚠️ Invalid due date format: {task_data['due_date']}")
-                        
-                        logger.info(f"🔄 [TASK_CREATE] Adding task to database session...")
-                        self.db.add(new_task)
-                        
-                        logger.info(f"🔄 [TASK_CREATE] Committing transaction...")
-                        self.db.commit()
-                        
-                        logger.info(f"✅ [TASK_CREATE] SUCCESSFULLY created task in database!")
-                        logger.info(f"✅ [TASK_CREATE] - Task ID: {new_task.id}")
-                        logger.info(f"✅ [TASK_CREATE] - Title: {new_task.title}")
-                        logger.info(f"✅ [TASK_CREATE] - Project ID: {new_task.project_id}")
-                        logger.info(f"✅ [TASK_CREATE] - Status: {new_task.status}")
-                        logger.info(f"✅ [TASK_CREATE] - Created at: {new_task.created_at}")
-                        result = {
-                            "success": True, 
-                            "message": f"Task created: {new_task.title}",
-                            "task_id": new_task.id
-                        }
-                except Exception as e:
-                    logger.error(f"[ERROR] Task creation failed: {e}")
-                    self.db.rollback()
-                    result = {"success": False, "message": f"Task creation failed: {str(e)}"}
+            elif action == "create_task":
+                # First try to get task_data from request (if frontend provides it),
+                # otherwise extract it from the email's analysis
+                task_data = data.get("task_data") or self._extract_task_data_from_email(com_service, email_id)
+                
+                if not task_data:
+                    logger.warning("[EMAIL_ACTION] No task data available for email: %s", email_id)
+                    result = {"success": False, "message": "No task data available - please analyze the email first"}
+                else:
+                    result = await self._db(self._create_task_from_data, task_data)
             
             # Send result back
             await manager.send_to_client(
@@ -497,13 +665,89 @@ class WSMessageHandler:
             )
             
         except Exception as e:
-            logger.error(f"Error applying email action: {e}")
+            logger.error("Error applying email action: %s", e)
             await manager.send_to_client(
                 self.websocket,
                 "email:action_error", 
                 {"message": f"Action failed: {str(e)}"}
             )
 
+    def _extract_task_data_from_email(self, com_service, email_id: str) -> Optional[Dict[str, Any]]:
+        """Find create_task task_data in the email's stored analysis"""
+        if not com_service or not com_service.is_connected_cached():
+            logger.warning("[EMAIL_ACTION] COM service not available or not connected")
+            return None
+        
+        email_details = com_service.get_email_details(email_id)
+        if not email_details:
+            logger.warning("[EMAIL_ACTION] get_email_details returned None")
+            return None
+        
+        analysis = email_details.get('analysis')
+        if not isinstance(analysis, dict):
+            logger.warning("[EMAIL_ACTION] No usable analysis in email details for: %s", email_id)
+            return None
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[EMAIL_ACTION] Email details keys: %s", list(email_details.keys()))
+            logger.debug("[EMAIL_ACTION] Analysis: %s", analysis)
+        
+        for suggested_action in analysis.get('suggested_actions') or []:
+            if suggested_action.get('type') == 'create_task' and 'task_data' in suggested_action:
+                return suggested_action['task_data']
+        
+        logger.warning("[EMAIL_ACTION] No create_task suggestion in analysis for: %s", email_id)
+        return None
+    
+    def _create_task_from_data(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert a task built from suggested task_data and return the action result"""
+        try:
+            row = {
+                "id": new_id(),
+                "title": task_data.get('title', 'Untitled Task'),
+                "objective": task_data.get('objective', ''),
+                "status": 'not_started',
+                "priority": task_data.get('priority', 3),
+                "sponsor_email": task_data.get('sponsor_email', ''),
+                "owner_email": task_data.get('owner_email', ''),
+                "project_id": task_data.get('project_id'),
+                "created_at": utc_now(),
+                "due_date": None
+            }
+            
+            # Parse due_date if provided
+            if task_data.get('due_date'):
+                try:
+                    row["due_date"] = parse_iso_datetime(task_data['due_date'])
+                except (ValueError, TypeError, AttributeError):
+                    logger.warning("Invalid due date format: %s", task_data['due_date'])
+            
+            logger.debug("[TASK_CREATE] Creating task: %s", row)
+            
+            self._insert_task_rows([row])
+            
+            logger.info("[TASK_CREATE] Created task %s: %s", row['id'], row['title'])
+            return {
+                "success": True, 
+                "message": f"Task created: {row['title']}",
+                "task_id": row['id']
+            }
+        except Exception as e:
+            logger.error("[ERROR] Task creation failed: %s", e)
+            self.db.rollback()
+            return {"success": False, "message": f"Task creation failed: {str(e)}"}
+
+    def _insert_task_rows(self, rows: List[Dict[str, Any]]):
+        """Insert task rows with one Core executemany and a single commit"""
+        # No ORM instances or unit-of-work; rows must all carry the same keys
+        self.db.execute(insert(Task.__table__), rows)
+        
+        # Core inserts bypass the ORM flush hook that maintains project counters
+        connection = self.db.connection()
+        for project_id, count in Counter(row["project_id"] for row in rows).items():
+            adjust_project_task_counts(connection, project_id, total=count)
+        self.db.commit()
+
     async def handle_interview_answer(self, data: Dict[str, Any]):
         """Handle interview question answer"""
         interview_id = data.get("interview_id")
@@ -512,16 +756,23 @@ class WSMessageHandler:
         if not interview_id or not answer:
             return
         
-        interview = self.db.query(Interview).filter(Interview.id == interview_id).first()
+        def record_answer():
+            interview = self.db.query(Interview).filter(Interview.id == interview_id).first()
+            if not interview:
+                return None
+            
+            # Record answer
+            interview.answer = answer
+            interview.answered_at = utc_now()
+            interview.status = "completed"
+            self.db.commit()
+            self.db.refresh(interview)
+            return interview
+        
+        interview = await self._db(record_answer)
         if not interview:
             return
         
-        # Record answer
-        interview.answer = answer
-        interview.answered_at = utc_now()
-        interview.status = "completed"
-        self.db.commit()
-        
         # Process answer with COS orchestrator
         await cos_orchestrator.process_interview_answer(interview, self.db)
 
@@ -532,13 +783,16 @@ class WSMessageHandler:
         if not interview_id:
             return
         
-        interview = self.db.query(Interview).filter(Interview.id == interview_id).first()
-        if not interview:
-            return
+        def dismiss():
+            interview = self.db.query(Interview).filter(Interview.id == interview_id).first()
+            if not interview:
+                return
+            
+            interview.status = "dismissed"
+            interview.dismissed_at = utc_now()
+            self.db.commit()
         
-        interview.status = "dismissed"
-        interview.dismissed_at = utc_now()
-        self.db.commit()
+        await self._db(dismiss)
 
     async def handle_project_create(self, data: Dict[str, Any]):
         """Create new project"""
@@ -548,14 +802,16 @@ class WSMessageHandler:
         if not name:
             return
         
-        project = Project(name=name, description=description)
-        self.db.add(project)
-        self.db.commit()
+        def create():
+            project = Project(name=name, description=description)
+            self.db.add(project)
+            self.db.commit()
+            return {"id": project.id, "name": project.name}
         
         await manager.send_to_client(
             self.websocket,
             "project:created",
-            {"id": project.id, "name": project.name}
+            await self._db(create)
         )
 
     async def handle_task_create(self, data: Dict[str, Any]):
@@ -567,14 +823,16 @@ class WSMessageHandler:
         if not title:
             return
         
-        task = Task(title=title, project_id=project_id, description=description)
-        self.db.add(task)
-        self.db.commit()
+        def create():
+            task = Task(title=title, project_id=project_id, description=description)
+            self.db.add(task)
+            self.db.commit()
+            return {"id": task.id, "title": task.title}
         
         await manager.send_to_client(
             self.websocket,
             "task:created",
-            {"id": task.id, "title": task.title}
+            await self._db(create)
         )
 
     async def handle_status_request(self, data: Dict[str, Any]):
@@ -584,44 +842,26 @@ class WSMessageHandler:
             # AI Status - only perform connection check after idle timeout
             if claude_client and hasattr(claude_client, 'client') and claude_client.should_check_connection():
                 # Only check AI connection after idle timeout to prevent rate limiting
-                try:
-                    # Quick health check - use cached response to avoid API call
-                    ai_status = {
-                        "status": "connected",
-                        "provider": "Anthropic", 
-                        "model": "Claude-3.5-Sonnet",
-                        "last_check": "idle_timeout_reached"
-                    }
-                    logger.info("AI status: Connection check allowed after idle period")
-                except Exception as e:
-                    ai_status = {
-                        "status": "error",
-                        "error": str(e),
-                        "provider": "Anthropic",
-                        "model": "Claude-3.5-Sonnet"
-                    }
-                    logger.error(f"AI connection check failed: {e}")
+                # Quick health check - use cached response to avoid API call
+                ai_status, ai_message = AI_STATUS_IDLE_CHECKED, AI_STATUS_IDLE_CHECKED_MESSAGE
+                logger.info("AI status: Connection check allowed after idle period")
             else:
                 # Skip connection check if not idle long enough or no client
-                ai_status = {
-                    "status": "connected" if claude_client and hasattr(claude_client, 'client') else "no_client",
-                    "provider": "Anthropic",
-                    "model": "Claude-3.5-Sonnet",
-                    "check_status": "skipped_idle_timeout" if claude_client else "no_client"
-                }
+                ai_status, ai_message = AI_STATUS_SKIPPED, AI_STATUS_SKIPPED_MESSAGE
             
             # Outlook Status - check COM service connection
-            outlook_status = {"status": "disconnected", "method": None}
+            outlook_status, outlook_message = OUTLOOK_STATUS_DISCONNECTED, OUTLOOK_STATUS_DISCONNECTED_MESSAGE
             try:
                 com_service = cos_orchestrator.email_triage.com_service
                 
-                if com_service and com_service.is_connected():
+                if com_service and com_service.is_connected_cached():
                     connection_info = com_service.get_connection_info()
                     outlook_status = {
                         "status": "connected",
                         "method": connection_info.get('method', 'com'),
                         "account_info": connection_info.get('account_info')
                     }
+                    outlook_message = encode_message("status:outlook", outlook_status)
                     logger.info(f"Status check: COM service connected")
                 else:
                     # Lightweight COM test without full connection
@@ -633,10 +873,7 @@ class WSMessageHandler:
                             outlook_app = win32com.client.GetActiveObject("Outlook.Application")
                             if outlook_app:
                                 logger.info("Status check: Outlook application is running")
-                                outlook_status = {
-                                    "status": "available",
-                                    "method": "com"
-                                }
+                                outlook_status, outlook_message = OUTLOOK_STATUS_AVAILABLE, OUTLOOK_STATUS_AVAILABLE_MESSAGE
                         except:
                             logger.info("Status check: Outlook application not accessible")
                         
@@ -644,8 +881,8 @@ class WSMessageHandler:
                 logger.info(f"Outlook status check failed: {e}")
             
             # Send status updates
-            await manager.send_to_client(self.websocket, "status:ai", ai_status)
-            await manager.send_to_client(self.websocket, "status:outlook", outlook_status)
+            await manager.send_raw_to_client(self.websocket, ai_message)
+            await manager.send_raw_to_client(self.websocket, outlook_message)
             
             # Send usage statistics update
             usage_stats = claude_client.get_usage_stats()
@@ -657,19 +894,90 @@ class WSMessageHandler:
             logger.error(f"Error handling status request: {e}")
 
     async def handle_load_dashboard(self, data: Dict[str, Any]):
-        """Load project dashboard data"""
+        """Load project dashboard data
+
+        With {"stream": true} the dashboard arrives as project:areas, project:projects and
+        project:tasks messages, each sent as soon as it is ready, instead of one project:data_update.
+        """
+        stream = bool(data.get("stream"))
+        streamed = False
+        try:
+            # Reuse the serialized payload if nothing was committed since it was built
+            if not dashboard_cache_fresh(db_revision):
+                async with dashboard_lock:
+                    # A concurrent loader may have rebuilt it while we waited. Take the revision
+                    # before building, so a commit landing mid-build marks the result stale
+                    revision = db_revision
+                    if not dashboard_cache_fresh(revision):
+                        sections = await self._build_dashboard_sections(stream)
+                        streamed = stream
+                        dashboard_cache["version"] = revision
+                        dashboard_cache["sections"] = sections
+                        dashboard_cache["payload"] = dashboard_message(sections)
+                        dashboard_cache["built_at"] = time.monotonic()
+            
+            if streamed:
+                return
+            if stream:
+                for section in DASHBOARD_SECTIONS:
+                    await manager.send_raw_to_client(
+                        self.websocket,
+                        dashboard_section_message(section, dashboard_cache["sections"][section])
+                    )
+            else:
+                await manager.send_raw_to_client(self.websocket, dashboard_cache["payload"])
+            
+        except Exception as e:
+            logger.error(f"Error loading dashboard data: {e}")
+            await manager.send_to_client(
+                self.websocket,
+                "error",
+                {"message": f"Failed to load dashboard: {str(e)}"}
+            )
+
+    async def _build_dashboard_sections(self, stream: bool = False) -> Dict[str, str]:
+        """Load areas, projects and tasks concurrently and serialize each section
+
+        With stream, each section is also sent to this client as soon as it and the ones
+        before it are ready, so areas can render while tasks are still loading.
+        """
+        loads = [
+            asyncio.ensure_future(self._db(loader))
+            for loader in (self._load_dashboard_areas, self._load_dashboard_projects, self._load_dashboard_tasks)
+        ]
+        sections = {}
         try:
-            from models import Area, Project, Task
+            for section, load in zip(DASHBOARD_SECTIONS, loads):
+                sections[section] = orjson.dumps(await load, default=str).decode()
+                if stream:
+                    await manager.send_raw_to_client(
+                        self.websocket, dashboard_section_message(section, sections[section])
+                    )
+        finally:
+            # Don't leave sibling loads unawaited if one of them failed
+            for load in loads:
+                load.cancel()
+        return sections
+
+    @staticmethod
+    def _load_dashboard_areas() -> List[Dict[str, Any]]:
+        """Areas with project and active task counts"""
+        db = ReadSessionLocal()
+        try:
+            # Per-area aggregates, one grouped query each
+            project_counts = dict(
+                db.query(Project.area_id, func.count(Project.id)).group_by(Project.area_id).all()
+            )
+            # lambda_stmt caches the statement construction as well as its compiled SQL
+            active_task_counts = dict(db.execute(lambda_stmt(
+                lambda: select(Project.area_id, func.count(Task.id))
+                .join(Task, Task.project_id == Project.id)
+                .where(Task.status.in_(DASHBOARD_ACTIVE_STATUSES))
+                .group_by(Project.area_id)
+            )).all())
             
-            # Load areas with project counts
             areas = []
-            for area in self.db.query(Area).order_by(Area.sort_order).all():
-                project_count = self.db.query(Project).filter_by(area_id=area.id).count()
-                active_task_count = self.db.query(Task).join(Project).filter(
-                    Project.area_id == area.id,
-                    Task.status.in_(['not_started', 'active'])
-                ).count()
-                
+            for area in db.query(Area).order_by(Area.sort_order).all():
                 areas.append({
                     "id": area.id,
                     "name": area.name,
@@ -678,85 +986,81 @@ class WSMessageHandler:
                     "is_system": area.is_system,
                     "is_default": area.is_default,
                     "sort_order": area.sort_order,
-                    "project_count": project_count,
-                    "active_tasks": active_task_count
+                    "project_count": project_counts.get(area.id, 0),
+                    "active_tasks": active_task_counts.get(area.id, 0)
                 })
-
-            # Load projects with task counts and health scores
+            return areas
+        finally:
+            db.close()
+
+    @staticmethod
+    def _load_dashboard_projects() -> List[Dict[str, Any]]:
+        """Projects with task counts, health scores and their next due task"""
+        db = ReadSessionLocal()
+        try:
+            # Earliest open task with a due date per project. SQLite fills the bare id/title
+            # columns from the row that holds MIN(due_date), so no window sort is needed
+            next_due_tasks = {
+                row.project_id: {
+                    "id": row.id,
+                    "title": row.title,
+                    "due_date": row.due_date
+                }
+                for row in db.execute(lambda_stmt(
+                    lambda: select(Task.project_id, Task.id, Task.title, func.min(Task.due_date).label("due_date"))
+                    .where(Task.status.in_(DASHBOARD_ACTIVE_STATUSES), Task.due_date.isnot(None))
+                    .group_by(Task.project_id)
+                )).all()
+            }
+            
+            # Plain row tuples; the payload needs no ORM instances
+            rows = db.execute(
+                select(
+                    Project.id, Project.name, Project.description, Project.area_id,
+                    Area.name.label("area_name"), Project.status, Project.priority,
+                    Project.is_catch_all, Project.is_system,
+                    func.coalesce(Project.color, Area.color).label("color"),
+                    Project.task_count, Project.completed_task_count.label("completed_tasks")
+                ).join(Area, Project.area_id == Area.id)
+                .order_by(Area.sort_order, Project.sort_order)
+            ).all()
+            
             projects = []
-            for project in self.db.query(Project).join(Area).order_by(Area.sort_order, Project.sort_order).all():
-                task_count = self.db.query(Task).filter_by(project_id=project.id).count()
-                completed_count = self.db.query(Task).filter_by(project_id=project.id, status='completed').count()
-                
+            for row in rows:
                 # Simple health score calculation (completion rate + activity)
-                completion_rate = (completed_count / task_count * 100) if task_count > 0 else 100
+                completion_rate = (row.completed_tasks / row.task_count * 100) if row.task_count > 0 else 100
                 health_score = int(completion_rate)  # Simplified for now
                 
-                # Get next due task
-                next_due_task = None
-                next_task = self.db.query(Task).filter_by(project_id=project.id)\
-                    .filter(Task.status.in_(['not_started', 'active']))\
-                    .filter(Task.due_date.isnot(None))\
-                    .order_by(Task.due_date).first()
-                
-                if next_task:
-                    next_due_task = {
-                        "id": next_task.id,
-                        "title": next_task.title,
-                        "due_date": next_task.due_date.isoformat() if next_task.due_date else None
-                    }
-
-                projects.append({
-                    "id": project.id,
-                    "name": project.name,
-                    "description": project.description,
-                    "area_id": project.area_id,
-                    "area_name": project.area.name,
-                    "status": project.status,
-                    "priority": project.priority,
-                    "is_catch_all": project.is_catch_all,
-                    "is_system": project.is_system,
-                    "color": project.color or project.area.color,
-                    "task_count": task_count,
-                    "completed_tasks": completed_count,
-                    "health_score": health_score,
-                    "next_due_task": next_due_task
-                })
-
-            # Load tasks
-            tasks = []
-            for task in self.db.query(Task).join(Project).join(Area).all():
-                tasks.append({
-                    "id": task.id,
-                    "title": task.title,
-                    "description": task.description,
-                    "status": task.status,
-                    "priority": task.priority,
-                    "due_date": task.due_date.isoformat() if task.due_date else None,
-                    "project_id": task.project_id,
-                    "project_name": task.project.name,
-                    "area_id": task.project.area_id,
-                    "area_name": task.project.area.name,
-                    "suggested_next": False  # TODO: Add AI suggestion logic
-                })
-
-            await manager.send_to_client(
-                self.websocket,
-                "project:data_update",
-                {
-                    "areas": areas,
-                    "projects": projects,
-                    "tasks": tasks
-                }
-            )
-            
-        except Exception as e:
-            logger.error(f"Error loading dashboard data: {e}")
-            await manager.send_to_client(
-                self.websocket,
-                "error",
-                {"message": f"Failed to load dashboard: {str(e)}"}
-            )
+                projects.append(dict(
+                    row._mapping,
+                    health_score=health_score,
+                    next_due_task=next_due_tasks.get(row.id)
+                ))
+            return projects
+        finally:
+            db.close()
+
+    @staticmethod
+    def _load_dashboard_tasks() -> List[Dict[str, Any]]:
+        """Tasks with their project and area names"""
+        db = ReadSessionLocal()
+        try:
+            # Load tasks with their project and area names as plain row tuples
+            rows = db.execute(
+                select(
+                    Task.id, Task.title, Task.objective, Task.status, Task.priority, Task.due_date,
+                    Task.project_id, Project.name.label("project_name"), Project.area_id,
+                    Area.name.label("area_name")
+                ).join(Project, Task.project_id == Project.id)
+                .join(Area, Project.area_id == Area.id)
+            ).all()
+            # due_date stays a datetime; orjson writes it in isoformat() form
+            return [
+                dict(row._mapping, suggested_next=False)  # TODO: Add AI suggestion logic
+                for row in rows
+            ]
+        finally:
+            db.close()
 
     async def handle_task_update(self, data: Dict[str, Any]):
         """Handle task status updates"""
@@ -766,15 +1070,18 @@ class WSMessageHandler:
         if not task_id:
             return
 
-        try:
+        def apply_updates():
             task = self.db.query(Task).filter_by(id=task_id).first()
             if not task:
-                return
+                return None
 
-            # Apply updates
+            # Apply updates to whitelisted fields only
             for key, value in updates.items():
-                if hasattr(task, key):
-                    setattr(task, key, value)
+                caster = TASK_UPDATABLE_FIELDS.get(key)
+                if caster:
+                    if value is None and key in TASK_REQUIRED_FIELDS:
+                        raise ValueError(f"{key} cannot be cleared")
+                    setattr(task, key, caster(value))
 
             # Set completed_at if status changed to completed
             if updates.get("status") == "completed" and task.completed_at is None:
@@ -782,17 +1089,21 @@ class WSMessageHandler:
             elif updates.get("status") != "completed":
                 task.completed_at = None
 
+            # Project completed_task_count is adjusted by the Task flush hook in this same commit
             self.db.commit()
+            return task.status
 
-            # Broadcast task status change
-            await manager.send_to_all(
-                "task:status_change",
-                {"task_id": task_id, "status": task.status}
-            )
+        try:
+            status = await self._db(apply_updates)
+            if status is None:
+                return
+
+            # Broadcast task status change, batched with others from the same burst
+            task_status_batcher.add(task_id, status)
 
         except Exception as e:
             logger.error(f"Error updating task {task_id}: {e}")
-            self.db.rollback()
+            await self._db(self.db.rollback)
 
     async def handle_insight_action(self, data: Dict[str, Any]):
         """Handle insight action execution"""
@@ -812,12 +1123,13 @@ class WSMessageHandler:
 
     async def handle_email_analyze(self, data: Dict[str, Any]):
         """Handle on-demand email analysis request"""
-        logger.info(f"🔄 [WEBSOCKET] Received email:analyze request with data: {data}")
+        logger.debug("[WEBSOCKET] Received email:analyze request with data: %s", data)
         
         try:
             email_id = data.get("email_id")
+            self._email_cache.pop(email_id, None)  # analysis is about to change
             if not email_id:
-                logger.error("❌ [WEBSOCKET] Email analysis failed: No email ID provided")
+                logger.error("[WEBSOCKET] Email analysis failed: No email ID provided")
                 await manager.send_to_client(
                     self.websocket,
                     "email:analysis_error", 
@@ -825,39 +1137,39 @@ class WSMessageHandler:
                 )
                 return
             
-            logger.info(f"🔄 [WEBSOCKET] Starting on-demand analysis for email: {email_id}")
+            logger.debug("[WEBSOCKET] Starting on-demand analysis for email: %s", email_id)
             
             # Use COM service for on-demand analysis
             com_service = cos_orchestrator.email_triage.com_service
-            logger.info(f"🔍 [WEBSOCKET] Got COM service: {com_service}")
+            logger.debug("[WEBSOCKET] Got COM service: %s", com_service)
             
             # Ensure COM connection
-            if not com_service.is_connected():
-                logger.info(f"🔄 [WEBSOCKET] COM not connected, attempting connection...")
-                connection_result = com_service.connect()
-                if not connection_result.get('connected'):
-                    logger.error(f"❌ [WEBSOCKET] Cannot analyze: {connection_result.get('message')}")
-                    await manager.send_to_client(
-                        self.websocket,
-                        "email:analysis_error", 
-                        {"message": f"Outlook connection failed: {connection_result.get('message', 'Unknown error')}", "email_id": email_id}
-                    )
-                    return
-            else:
-                logger.info(f"✅ [WEBSOCKET] COM service already connected")
+            connection_result = com_service.ensure_connected()
+            if not connection_result.get('connected'):
+                logger.error("[WEBSOCKET] Cannot analyze: %s", connection_result.get('message'))
+                await manager.send_to_client(
+                    self.websocket,
+                    "email:analysis_error", 
+                    {"message": f"Outlook connection failed: {connection_result.get('message', 'Unknown error')}", "email_id": email_id}
+                )
+                return
             
             # Analyze single email on-demand with timeout protection
-            logger.info(f"🔄 [WEBSOCKET] About to call com_service.analyze_single_email({email_id}) with timeout")
+            logger.debug("[WEBSOCKET] About to call com_service.analyze_single_email(%s) with timeout", email_id)
             try:
+                # Analysis already stored on the Outlook item is reused unless the client
+                # explicitly asks to re-process, which skips the AI call on repeat clicks
+                force_reanalysis = bool(data.get("force_reanalysis"))
                 # Add 60 second timeout to prevent infinite hangs
                 analyzed_email = await asyncio.wait_for(
-                    com_service.analyze_single_email(email_id, db=self.db), 
+                    com_service.analyze_single_email(email_id, force_reanalysis=force_reanalysis, db=self.db), 
                     timeout=60.0
                 )
-                logger.info(f"✅ [WEBSOCKET] analyze_single_email returned: {type(analyzed_email)} with keys: {list(analyzed_email.keys()) if analyzed_email else 'None'}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[WEBSOCKET] analyze_single_email returned: %s with keys: %s", type(analyzed_email), list(analyzed_email.keys()) if analyzed_email else 'None')
                 
             except asyncio.TimeoutError:
-                logger.error(f"❌ [WEBSOCKET] Email analysis timed out after 60 seconds for: {email_id}")
+                logger.error("[WEBSOCKET] Email analysis timed out after 60 seconds for: %s", email_id)
                 await manager.send_to_client(
                     self.websocket,
                     "email:analysis_error", 
@@ -865,7 +1177,7 @@ class WSMessageHandler:
                 )
                 return
             except Exception as analysis_e:
-                logger.error(f"❌ [WEBSOCKET] Email analysis failed: {analysis_e}")
+                logger.error("[WEBSOCKET] Email analysis failed: %s", analysis_e)
                 await manager.send_to_client(
                     self.websocket,
                     "email:analysis_error",
@@ -875,10 +1187,10 @@ class WSMessageHandler:
             
             if analyzed_email and analyzed_email.get('analysis'):
                 analysis = analyzed_email['analysis']
-                logger.info(f"✅ [WEBSOCKET] On-demand analysis completed: Priority={analysis.get('priority')}, Tone={analysis.get('tone')}, Urgency={analysis.get('urgency')}")
+                logger.info("[WEBSOCKET] On-demand analysis completed: Priority=%s, Tone=%s, Urgency=%s", analysis.get('priority'), analysis.get('tone'), analysis.get('urgency'))
                 
                 # Send the complete analyzed email data
-                logger.info(f"🔄 [WEBSOCKET] Sending email:analyzed event to client...")
+                logger.debug("[WEBSOCKET] Sending email:analyzed event to client...")
                 await manager.send_to_client(
                     self.websocket,
                     "email:analyzed",
@@ -888,12 +1200,12 @@ class WSMessageHandler:
                         "analysis": analysis
                     }
                 )
-                logger.info(f"✅ [WEBSOCKET] Successfully sent email:analyzed event")
+                logger.debug("[WEBSOCKET] Successfully sent email:analyzed event")
                 
                 # Send structured recommendations to COS chat
                 await self._send_email_recommendations_to_chat(email_id, analysis, analyzed_email)
             else:
-                logger.warning(f"⚠️ [WEBSOCKET] Analysis failed or returned empty results for email: {email_id}")
+                logger.warning("[WEBSOCKET] Analysis failed or returned empty results for email: %s", email_id)
                 await manager.send_to_client(
                     self.websocket,
                     "email:analysis_error",
@@ -901,9 +1213,9 @@ class WSMessageHandler:
                 )
             
         except Exception as e:
-            logger.error(f"❌ [WEBSOCKET] Error analyzing email: {e}")
+            logger.error("[WEBSOCKET] Error analyzing email: %s", e)
             import traceback
-            logger.error(f"❌ [WEBSOCKET] Traceback: {traceback.format_exc()}")
+            logger.error("[WEBSOCKET] Traceback: %s", traceback.format_exc())
             await manager.send_to_client(
                 self.websocket,
                 "email:analysis_error",
@@ -913,12 +1225,11 @@ class WSMessageHandler:
     async def _send_email_recommendations_to_chat(self, email_id: str, analysis: Dict[str, Any], email_data: Dict[str, Any]):
         """Send structured email recommendations to COS chat as clickable links"""
         try:
-            import time
             suggested_actions = analysis.get('suggested_actions', [])
             email_subject = email_data.get('subject', 'Email')[:50]
             
             if not suggested_actions:
-                logger.info(f"🔍 [RECOMMENDATIONS] No structured actions found for email: {email_id}")
+                logger.debug("[RECOMMENDATIONS] No structured actions found for email: %s", email_id)
                 return
             
             # Create natural executive assistant message with clickable actions
@@ -959,7 +1270,7 @@ class WSMessageHandler:
                 "actions": suggested_actions
             }
             
-            logger.info(f"📨 [RECOMMENDATIONS] Sending recommendations to chat for email: {email_id}")
+            logger.debug("[RECOMMENDATIONS] Sending recommendations to chat for email: %s", email_id)
             await manager.send_to_client(
                 self.websocket,
                 "thread:append",
@@ -967,26 +1278,23 @@ class WSMessageHandler:
             )
             
         except Exception as e:
-            logger.error(f"❌ [RECOMMENDATIONS] Error sending recommendations to chat: {e}")
+            logger.error("[RECOMMENDATIONS] Error sending recommendations to chat: %s", e)
             import traceback
-            logger.error(f"❌ [RECOMMENDATIONS] Traceback: {traceback.format_exc()}")
+            logger.error("[RECOMMENDATIONS] Traceback: %s", traceback.format_exc())
 
     async def handle_email_recommendation_action(self, data: Dict[str, Any]):
         """Handle execution of email recommendation actions"""
         try:
-            import time
             action_type = data.get('action_type', '')
             action_data = data.get('action_data', {})
             email_id = data.get('email_id')
+            self._email_cache.pop(email_id, None)
             
-            logger.info(f"🔄 [EMAIL_ACTION] STARTING recommendation action")
-            logger.info(f"🔄 [EMAIL_ACTION] - Action: {action_type}")
-            logger.info(f"🔄 [EMAIL_ACTION] - Email ID: {email_id}")
-            logger.info(f"🔄 [EMAIL_ACTION] - Action Data: {action_data}")
-            logger.info(f"🔄 [EMAIL_ACTION] - Full Request: {data}")
+            logger.debug("[EMAIL_ACTION] Starting recommendation action %s for email %s: %s", action_type, email_id, action_data)
             
             # Save user selection to Outlook for training and execute action
             success = False
+            created_task_info = None  # title/project/area of a task created below, for the response message
             if email_id:
                 try:
                     # Get COM service from global orchestrator
@@ -994,50 +1302,49 @@ class WSMessageHandler:
                     com_service = cos_orchestrator.email_triage.com_service
                     
                     # Ensure COM connection
-                    if not com_service.is_connected():
-                        connection_result = com_service.connect()
-                        if not connection_result.get('connected'):
-                            logger.error(f"❌ [EMAIL_ACTION] Cannot connect to Outlook: {connection_result.get('message')}")
-                            raise Exception("Outlook connection failed")
+                    connection_result = com_service.ensure_connected()
+                    if not connection_result.get('connected'):
+                        logger.error("[EMAIL_ACTION] Cannot connect to Outlook: %s", connection_result.get('message'))
+                        raise Exception("Outlook connection failed")
                     
                     # Find email in Outlook by ID
                     outlook_item = com_service.com_connector._get_item_by_id(email_id)
                     if outlook_item:
                         # Save user selection for training
-                        from integrations.outlook.property_sync import save_selected_action_to_outlook
                         save_selected_action_to_outlook(outlook_item, action_type, action_data)
-                        logger.info(f"📊 [TRAINING] Recorded user selection: {action_type} for email: {email_id}")
+                        logger.info("[TRAINING] Recorded user selection: %s for email: %s", action_type, email_id)
                         
                         # Execute the actual action
                         if action_type == 'archive':
-                            # Ensure COS_Archive folder exists
-                            folder_result = com_service.create_folder('COS_Archive', 'Inbox')  # Won't create if exists
-                            logger.info(f"📂 [EMAIL_ACTION] COS_Archive folder check result: {folder_result}")
+                            # Ensure COS_Archive folder exists (checked in Outlook once per process)
+                            folder_result = com_service.ensure_folder('COS_Archive', 'Inbox')
+                            logger.debug("[EMAIL_ACTION] COS_Archive folder check result: %s", folder_result)
                             
                             # Move email to COS_Archive folder
                             result = com_service.move_email(email_id, 'COS_Archive')
                             if result:
                                 success = True
-                                logger.info(f"✅ [EMAIL_ACTION] Successfully archived email: {email_id}")
+                                logger.info("[EMAIL_ACTION] Successfully archived email: %s", email_id)
                             else:
-                                logger.error(f"❌ [EMAIL_ACTION] Failed to archive email: {email_id}")
+                                # The folder may have been deleted; re-check it on the next archive
+                                com_service.forget_folder('COS_Archive', 'Inbox')
+                                logger.error("[EMAIL_ACTION] Failed to archive email: %s", email_id)
                         elif action_type == 'create_task':
                             # Get email details and analysis using proper COM schema approach
-                            logger.info(f"🔄 [TASK_CREATE] Getting email details for task creation: {email_id}")
+                            logger.debug("[TASK_CREATE] Getting email details for task creation: %s", email_id)
                             
                             # Use same approach as the working email analysis flow
                             try:
-                                from schemas.email_schema import create_email_from_com, email_to_dict
                                 email_schema = create_email_from_com(outlook_item, skip_analysis=True)
                                 email_data = email_to_dict(email_schema)
-                                logger.info(f"🔄 [TASK_CREATE] Retrieved email data using schema: {email_data.get('subject', 'Unknown')[:50]}")
+                                logger.debug("[TASK_CREATE] Retrieved email data using schema: %s", email_data.get('subject', 'Unknown')[:50])
                             except Exception as e:
-                                logger.error(f"❌ [TASK_CREATE] Failed to load email via schema: {e}")
+                                logger.error("[TASK_CREATE] Failed to load email via schema: %s", e)
                                 email_data = None
                             
                             if email_data and email_data.get('analysis'):
                                 analysis = email_data['analysis']
-                                logger.info(f"🔄 [TASK_CREATE] Found email analysis: {analysis}")
+                                logger.debug("[TASK_CREATE] Found email analysis: %s", analysis)
                                 
                                 # Look for create_task action in suggested_actions
                                 task_data = None
@@ -1045,27 +1352,59 @@ class WSMessageHandler:
                                     for action in analysis['suggested_actions']:
                                         if action.get('type') == 'create_task' and 'task_data' in action:
                                             task_data = action['task_data']
-                                            logger.info(f"🔄 [TASK_CREATE] Found task_data in email analysis: {task_data}")
+                                            logger.debug("[TASK_CREATE] Found task_data in email analysis: %s", task_data)
                                             break
                                 
                                 if task_data:
-                                    logger.info(f"🔄 [TASK_CREATE] Creating task with data: {task_data}")
+                                    logger.debug("[TASK_CREATE] Creating task with data: %s", task_data)
                                     
                                     # Find the best matching project using AI-powered analysis
-                                    from sqlalchemy.orm import sessionmaker
-                                    from sqlalchemy import create_engine
-                                    from models import Task, Project, Area
+                                    session = WorkerSessionLocal()
+                                    
+                                    # Session work runs in worker threads; only the AI call stays on the loop
+                                    def load_candidates():
+                                        return session.query(Area).all(), session.query(Project).filter_by(status='active').all()
                                     
-                                    engine = create_engine('sqlite:///cos.db', echo=False)
-                                    Session = sessionmaker(bind=engine)
-                                    session = Session()
+                                    def find_fallback_project():
+                                        work_area = session.query(Area).filter_by(name="Work").first()
+                                        if not work_area:
+                                            return None, None
+                                        default_project = session.query(Project).filter_by(
+                                            area_id=work_area.id, 
+                                            is_catch_all=True
+                                        ).first()
+                                        return work_area, default_project
+                                    
+                                    def add_task(project_id):
+                                        # Parse due date
+                                        due_date = None
+                                        if task_data.get('due_date'):
+                                            try:
+                                                due_date = parse_iso_datetime(task_data['due_date'])
+                                            except:
+                                                logger.warning("[TASK_CREATE] Could not parse due_date: %s", task_data.get('due_date'))
+                                        
+                                        new_task = Task(
+                                            title=task_data.get('title', 'New task from email'),
+                                            objective=task_data.get('objective', 'Review and respond to email'),
+                                            project_id=project_id,
+                                            priority=task_data.get('priority', 3),
+                                            due_date=due_date,
+                                            sponsor_email=task_data.get('sponsor_email', 'system@company.com'),
+                                            owner_email=task_data.get('owner_email', 'user@company.com'),
+                                            status='not_started'
+                                        )
+                                        title = new_task.title
+                                        
+                                        session.add(new_task)
+                                        session.commit()
+                                        return title
                                     
                                     try:
                                         # Get all available areas and projects for matching
-                                        all_areas = session.query(Area).all()
-                                        all_projects = session.query(Project).filter_by(status='active').all()
+                                        all_areas, all_projects = await self._db(load_candidates)
                                         
-                                        logger.info(f"🔄 [TASK_CREATE] Found {len(all_areas)} areas and {len(all_projects)} active projects")
+                                        logger.debug("[TASK_CREATE] Found %s areas and %s active projects", len(all_areas), len(all_projects))
                                         
                                         # Use AI to find the best matching project
                                         best_project = await self._find_best_project_for_task(
@@ -1073,132 +1412,62 @@ class WSMessageHandler:
                                         )
                                         
                                         if best_project:
-                                            # Parse due date
-                                            due_date = None
-                                            if task_data.get('due_date'):
-                                                from datetime import datetime
-                                                try:
-                                                    due_date = datetime.fromisoformat(task_data['due_date'])
-                                                except:
-                                                    logger.warning(f"⚠️ [TASK_CREATE] Could not parse due_date: {task_data.get('due_date')}")
-                                            
-                                            # Create the task in the AI-selected project
-                                            new_task = Task(
-                                                title=task_data.get('title', 'New task from email'),
-                                                objective=task_data.get('objective', 'Review and respond to email'),
-                                                project_id=best_project.id,
-                                                priority=task_data.get('priority', 3),
-                                                due_date=due_date,
-                                                sponsor_email=task_data.get('sponsor_email', 'system@company.com'),
-                                                owner_email=task_data.get('owner_email', 'user@company.com'),
-                                                status='not_started'
-                                            )
-                                            
-                                            session.add(new_task)
-                                            session.commit()
-                                            
-                                            # Store project and area info for response message
+                                            # Store project and area info for response message (read before commit expires them)
                                             project_name = best_project.name
                                             area_name = best_project.area.name
                                             
-                                            logger.info(f"✅ [TASK_CREATE] Successfully created task: '{new_task.title}' in project '{project_name}', area '{area_name}'")
+                                            # Create the task in the AI-selected project
+                                            task_title = await self._db(add_task, best_project.id)
+                                            
+                                            logger.info("[TASK_CREATE] Successfully created task: '%s' in project '%s', area '%s'", task_title, project_name, area_name)
+                                            created_task_info = {'title': task_title, 'project': project_name, 'area': area_name}
                                             success = True
                                         else:
                                             # Fallback to default Tasks project if AI matching fails
-                                            logger.warning(f"⚠️ [TASK_CREATE] AI project matching failed, using default Tasks project")
-                                            work_area = session.query(Area).filter_by(name="Work").first()
+                                            logger.warning("[TASK_CREATE] AI project matching failed, using default Tasks project")
+                                            work_area, default_project = await self._db(find_fallback_project)
                                             if work_area:
-                                                default_project = session.query(Project).filter_by(
-                                                    area_id=work_area.id, 
-                                                    is_catch_all=True
-                                                ).first()
                                                 if default_project:
-                                                    # Parse due date
-                                                    due_date = None
-                                                    if task_data.get('due_date'):
-                                                        from datetime import datetime
-                                                        try:
-                                                            due_date = datetime.fromisoformat(task_data['due_date'])
-                                                        except:
-                                                            logger.warning(f"⚠️ [TASK_CREATE] Could not parse due_date: {task_data.get('due_date')}")
-                                                    
-                                                    # Create task in default project
-                                                    new_task = Task(
-                                                        title=task_data.get('title', 'New task from email'),
-                                                        objective=task_data.get('objective', 'Review and respond to email'),
-                                                        project_id=default_project.id,
-                                                        priority=task_data.get('priority', 3),
-                                                        due_date=due_date,
-                                                        sponsor_email=task_data.get('sponsor_email', 'system@company.com'),
-                                                        owner_email=task_data.get('owner_email', 'user@company.com'),
-                                                        status='not_started'
-                                                    )
-                                                    
-                                                    session.add(new_task)
-                                                    session.commit()
-                                                    
                                                     # Store info for response message
                                                     project_name = default_project.name
                                                     area_name = work_area.name
                                                     
-                                                    logger.info(f"✅ [TASK_CREATE] Created task in fallback project: '{new_task.title}' in project '{project_name}', area '{area_name}'")
+                                                    # Create task in default project
+                                                    task_title = await self._db(add_task, default_project.id)
+                                                    
+                                                    logger.info("[TASK_CREATE] Created task in fallback project: '%s' in project '%s', area '%s'", task_title, project_name, area_name)
+                                                    created_task_info = {'title': task_title, 'project': project_name, 'area': area_name}
                                                     success = True
                                                 else:
-                                                    logger.error(f"❌ [TASK_CREATE] Could not find default Tasks project")
+                                                    logger.error("[TASK_CREATE] Could not find default Tasks project")
                                                     success = False
                                             else:
-                                                logger.error(f"❌ [TASK_CREATE] Could not find Work area")
+                                                logger.error("[TASK_CREATE] Could not find Work area")
                                                 success = False
                                                 
                                     except Exception as e:
-                                        logger.error(f"❌ [TASK_CREATE] Database error: {e}")
-                                        session.rollback()
+                                        logger.error("[TASK_CREATE] Database error: %s", e)
+                                        await self._db(session.rollback)
                                         success = False
                                     finally:
-                                        session.close()
+                                        await self._db(session.close)
                                 else:
-                                    logger.warning(f"⚠️ [TASK_CREATE] No task_data found in email analysis")
+                                    logger.warning("[TASK_CREATE] No task_data found in email analysis")
                                     success = False
                             else:
-                                logger.warning(f"⚠️ [TASK_CREATE] No email analysis data found")
+                                logger.warning("[TASK_CREATE] No email analysis data found")
                                 success = False
                         elif action_type in ['flag_category', 'save_later', 'save_reference']:
                             # For other actions, just mark as successful for now (implement later)
                             success = True
                         
                     else:
-                        logger.warning(f"⚠️ [EMAIL_ACTION] Could not find email in Outlook for ID: {email_id}")
+                        logger.warning("[EMAIL_ACTION] Could not find email in Outlook for ID: %s", email_id)
                         
                 except Exception as e:
-                    logger.error(f"❌ [EMAIL_ACTION] Failed to execute action: {e}")
+                    logger.error("[EMAIL_ACTION] Failed to execute action: %s", e)
                     success = False
             
-            # Store task info for response message
-            created_task_info = None
-            if action_type == 'create_task' and success:
-                # Get the actual task info that was created
-                try:
-                    from sqlalchemy.orm import sessionmaker
-                    from sqlalchemy import create_engine
-                    from models import Task
-                    
-                    engine = create_engine('sqlite:///cos.db', echo=False)
-                    Session = sessionmaker(bind=engine)
-                    session = Session()
-                    
-                    # Get the most recently created task with project and area info
-                    latest_task = session.query(Task).order_by(Task.created_at.desc()).first()
-                    if latest_task:
-                        created_task_info = {
-                            'title': latest_task.title,
-                            'project': latest_task.project.name,
-                            'area': latest_task.project.area.name
-                        }
-                        logger.info(f"📋 [RESPONSE] Task info for response: '{created_task_info['title']}' in project '{created_task_info['project']}', area '{created_task_info['area']}'")
-                    session.close()
-                except Exception as e:
-                    logger.warning(f"⚠️ [RESPONSE] Could not get task info: {e}")
-            
             # Send success/failure message and trigger optimistic UI updates
             if action_type == 'archive':
                 if success:
@@ -1230,16 +1499,10 @@ class WSMessageHandler:
                 response_message = f"✅ Action '{action_type}' executed" if success else f"❌ Action '{action_type}' failed"
             
             # Send confirmation banner to COS chat
-            message_data = {
-                "id": f"recommendation_result_{int(time.time() * 1000)}",
-                "text": response_message,
-                "timestamp": utc_timestamp(),
-                "sender": "system",
-                "isStatus": True,
-                "success": success,
-                "action_type": action_type,
-                "email_id": email_id
-            }
+            message_data = self._status_message(
+                "recommendation_result", response_message,
+                success=success, action_type=action_type, email_id=email_id
+            )
             
             await manager.send_to_client(
                 self.websocket,
@@ -1247,21 +1510,15 @@ class WSMessageHandler:
                 {"message": message_data}
             )
             
-            logger.info(f"✅ [EMAIL_ACTION] Action '{action_type}' completed successfully")
+            logger.info("[EMAIL_ACTION] Action '%s' completed successfully", action_type)
             
         except Exception as e:
-            logger.error(f"❌ [EMAIL_ACTION] Error executing recommendation action: {e}")
+            logger.error("[EMAIL_ACTION] Error executing recommendation action: %s", e)
             import traceback
-            logger.error(f"❌ [EMAIL_ACTION] Traceback: {traceback.format_exc()}")
+            logger.error("[EMAIL_ACTION] Traceback: %s", traceback.format_exc())
             
             # Send error message to chat
-            error_message = {
-                "id": f"recommendation_error_{int(time.time() * 1000)}",
-                "text": f"❌ Failed to execute action: {str(e)}",
-                "timestamp": utc_timestamp(),
-                "sender": "system",
-                "isStatus": True
-            }
+            error_message = self._status_message("recommendation_error", f"❌ Failed to execute action: {str(e)}")
             
             await manager.send_to_client(
                 self.websocket,
@@ -1272,7 +1529,6 @@ class WSMessageHandler:
     async def handle_email_selected(self, data: Dict[str, Any]):
         """Handle when user selects an email - check for existing recommendations"""
         try:
-            import time
             email_id = data.get('email_id')
             if not email_id:
                 logger.warning("📧 [EMAIL_SELECTED] No email ID provided")
@@ -1280,26 +1536,31 @@ class WSMessageHandler:
                 
             logger.info(f"📧 [EMAIL_SELECTED] User selected email: {email_id}")
             
-            # Use COM service to get the specific email with existing analysis
-            com_service = cos_orchestrator.email_triage.com_service
-            
-            # Ensure COM connection
-            if not com_service.is_connected():
-                connection_result = com_service.connect()
+            email_data = self._cached_email_data(email_id)
+            if email_data is None:
+                # Use COM service to get the specific email with existing analysis
+                com_service = cos_orchestrator.email_triage.com_service
+                
+                # Ensure COM connection
+                connection_result = com_service.ensure_connected(COM_PROBE_TTL)
                 if not connection_result.get('connected'):
                     logger.error(f"❌ [EMAIL_SELECTED] Cannot get email: {connection_result.get('message')}")
                     return
-            
-            # Get email data by ID to access existing COS properties
-            outlook_item = com_service.com_connector._get_item_by_id(email_id)
-            if not outlook_item:
-                logger.warning(f"⚠️ [EMAIL_SELECTED] Could not find email with ID: {email_id}")
-                return
-            
-            # Extract email data using schema
-            from schemas.email_schema import create_email_from_com, email_to_dict
-            email_schema = create_email_from_com(outlook_item, skip_analysis=True)  # Don't trigger new analysis
-            email_data = email_to_dict(email_schema)
+                
+                def load_email_data():
+                    # Get email data by ID to access existing COS properties
+                    outlook_item = com_service.com_connector._get_item_by_id(email_id)
+                    if not outlook_item:
+                        return None
+                    # Extract email data using schema
+                    email_schema = create_email_from_com(outlook_item, skip_analysis=True)  # Don't trigger new analysis
+                    return email_to_dict(email_schema)
+                
+                email_data = await self._com(load_email_data)
+                if email_data is None:
+                    logger.warning(f"⚠️ [EMAIL_SELECTED] Could not find email with ID: {email_id}")
+                    return
+                self._cache_email_data(email_id, email_data)
             
             # Check if email has existing analysis with recommendations
             analysis = email_data.get('analysis', {})
@@ -1314,13 +1575,7 @@ class WSMessageHandler:
                     logger.info(f"📧 [EMAIL_SELECTED] No existing recommendations found for: {email_data.get('subject', 'Unknown')[:50]}")
                     
                     # Send message indicating no recommendations available
-                    message_data = {
-                        "id": f"no_recommendations_{email_id}_{int(time.time() * 1000)}",
-                        "text": f"ℹ️ No recommendations available for this email. Click 'Analyze' to generate recommendations.",
-                        "timestamp": utc_timestamp(),
-                        "sender": "system",
-                        "isStatus": True
-                    }
+                    message_data = self._status_message(f"no_recommendations_{email_id}", NO_RECOMMENDATIONS_TEXT)
                     
                     await manager.send_to_client(
                         self.websocket,
@@ -1331,13 +1586,7 @@ class WSMessageHandler:
                 logger.info(f"📧 [EMAIL_SELECTED] No analysis data found for: {email_data.get('subject', 'Unknown')[:50]}")
                 
                 # Send message indicating analysis needed
-                message_data = {
-                    "id": f"needs_analysis_{email_id}_{int(time.time() * 1000)}",
-                    "text": f"ℹ️ This email hasn't been analyzed yet. Click 'Analyze' to generate recommendations.",
-                    "timestamp": utc_timestamp(),
-                    "sender": "system",
-                    "isStatus": True
-                }
+                message_data = self._status_message(f"needs_analysis_{email_id}", NEEDS_ANALYSIS_TEXT)
                 
                 await manager.send_to_client(
                     self.websocket,
@@ -1346,35 +1595,73 @@ class WSMessageHandler:
                 )
                 
         except Exception as e:
+            # Only a COM failure means the Outlook connection may be dead
+            if isinstance(e, COMError):
+                cos_orchestrator.email_triage.com_service.reset_connection()
             logger.error(f"❌ [EMAIL_SELECTED] Error handling email selection: {e}")
             import traceback
             logger.error(f"❌ [EMAIL_SELECTED] Traceback: {traceback.format_exc()}")
 
+    async def handle_email_get_body(self, data: Dict[str, Any]):
+        """Send the full body of one email; list loads only carry body_preview"""
+        email_id = data.get('email_id')
+        if not email_id:
+            return
+        try:
+            com_service = cos_orchestrator.email_triage.com_service
+            connection_result = com_service.ensure_connected(COM_PROBE_TTL)
+            if not connection_result.get('connected'):
+                raise RuntimeError(f"Outlook connection failed: {connection_result.get('message', 'Unknown error')}")
+            
+            def load_body():
+                outlook_item = com_service.com_connector._get_item_by_id(email_id)
+                if not outlook_item:
+                    raise LookupError(f"Email not found: {email_id}")
+                return getattr(outlook_item, "Body", "") or ""
+            
+            await manager.send_to_client(
+                self.websocket,
+                "email:body",
+                {"email_id": email_id, "body_content": await self._com(load_body)}
+            )
+        except Exception as e:
+            # Only a COM failure means the Outlook connection may be dead
+            if isinstance(e, COMError):
+                cos_orchestrator.email_triage.com_service.reset_connection()
+            logger.error(f"❌ Failed to load body for email {email_id}: {e}")
+            await manager.send_to_client(
+                self.websocket,
+                "email:fetch_error",
+                {"message": f"Failed to load email body: {str(e)}", "email_id": email_id}
+            )
+
     async def handle_get_recent_emails(self, data: Dict[str, Any]):
         """Handle request for recent emails with AI analysis"""
         try:
             limit = data.get("limit", 10)
+            # Full bodies are fetched on selection via email:get_body unless asked for here
+            include_body = bool(data.get("include_body"))
             logger.info(f"📧 Getting {limit} recent emails using COM-only service")
             
             # Use pure COM service for email loading with analysis
             com_service = cos_orchestrator.email_triage.com_service
             
             # Ensure COM connection
-            if not com_service.is_connected():
-                connection_result = com_service.connect()
-                if not connection_result.get('connected'):
-                    logger.error(f"❌ Failed to connect to Outlook: {connection_result.get('message')}")
-                    await manager.send_to_client(
-                        self.websocket,
-                        "email:fetch_error", 
-                        {"message": f"Outlook connection failed: {connection_result.get('message', 'Unknown error')}"}
-                    )
-                    return
-                else:
-                    logger.info(f"✅ Connected to Outlook via {connection_result.get('method')}")
+            connection_result = com_service.ensure_connected(COM_PROBE_TTL)
+            if not connection_result.get('connected'):
+                logger.error(f"❌ Failed to connect to Outlook: {connection_result.get('message')}")
+                await manager.send_to_client(
+                    self.websocket,
+                    "email:fetch_error", 
+                    {"message": f"Outlook connection failed: {connection_result.get('message', 'Unknown error')}"}
+                )
+                return
             
             # Load emails WITHOUT automatic analysis (only existing COS properties)
-            emails = com_service.get_recent_emails_without_analysis("Inbox", limit)
+            # Drop bodies as each message is read unless the client wants them; body_preview is unaffected
+            emails = await self._com(
+                com_service.get_recent_emails_without_analysis, "Inbox", limit, None if include_body else 0
+            )
             logger.info(f"📧 Retrieved {len(emails)} emails without proactive analysis")
             
             if emails:
@@ -1382,9 +1669,21 @@ class WSMessageHandler:
                 batch_size = data.get("batch_size", 10)  # Default to 10 emails per batch
                 total_emails = len(emails)
                 
+                # Opt-in pause between batches for clients that want visibly progressive loading
+                batch_delay = data.get("artificial_delay_ms", 0) / 1000
+                
+                # Small loads are formatted in one go anyway, so their messages share a single frame
+                outbox: List[Tuple[str, Any]] = []
+                coalesce = total_emails <= EMAIL_COALESCE_LIMIT and not batch_delay
+                
+                async def emit(event: str, payload: Dict[str, Any]):
+                    if coalesce:
+                        outbox.append((event, payload))
+                    else:
+                        await manager.send_to_client(self.websocket, event, payload)
+                
                 # Send initial progress update
-                await manager.send_to_client(
-                    self.websocket,
+                await emit(
                     "email:load_progress",
                     {
                         "status": "loading",
@@ -1394,49 +1693,36 @@ class WSMessageHandler:
                     }
                 )
                 
+                # Uncoalesced batches are sent double-buffered: batch N goes out while N+1 is formatted
+                send_task: Optional[asyncio.Task] = None
+                
                 # Process emails in batches
-                for batch_start in range(0, total_emails, batch_size):
-                    batch_end = min(batch_start + batch_size, total_emails)
-                    batch_emails = emails[batch_start:batch_end]
+                batch_end = 0
+                for batch_emails in chunks(emails, batch_size):
+                    batch_start = batch_end
+                    batch_end = batch_start + len(batch_emails)
                     
                     # Format emails in this batch
                     formatted_batch = []
+                    analyzed_count = 0
+                    debug_enabled = logger.isEnabledFor(logging.DEBUG)
                     for email_data in batch_emails:
                         try:
                             # Convert to frontend format
-                            simple_email = {
-                                "id": email_data.get("id", "unknown"),
-                                "subject": email_data.get("subject", "No Subject"),
-                                "sender_name": email_data.get("sender_name", "Unknown Sender"),
-                                "sender_email": email_data.get("sender_email", ""),
-                                "sender": email_data.get("sender", ""),
-                                "to_recipients": email_data.get("to_recipients", []),
-                                "cc_recipients": email_data.get("cc_recipients", []),
-                                "bcc_recipients": email_data.get("bcc_recipients", []),
-                                "body_content": email_data.get("body_content", ""),
-                                "body_preview": email_data.get("body_preview", ""),
-                                "received_at": self._format_datetime(email_data.get("received_at")),
-                                "is_read": email_data.get("is_read", False),
-                                "has_attachments": email_data.get("has_attachments", False),
-                                "importance": email_data.get("importance", "normal"),
-                                "analysis": email_data.get("analysis", {}),  # COM service includes analysis
-                                "project_id": email_data.get("project_id"),
-                                "confidence": email_data.get("confidence"),
-                                "provenance": email_data.get("provenance")
-                            }
+                            simple_email = {key: email_data.get(key, default) for key, default in EMAIL_FIELD_DEFAULTS.items()}
+                            simple_email["received_at"] = self._format_datetime(simple_email["received_at"])
+                            if not include_body:
+                                simple_email["body_content"] = None
                             
                             # Extract analysis properties for backward compatibility
-                            analysis = simple_email.get("analysis", {})
-                            if analysis and isinstance(analysis, dict):
-                                simple_email["priority"] = analysis.get("priority", "MEDIUM")
-                                simple_email["tone"] = analysis.get("tone", "PROFESSIONAL") 
-                                simple_email["urgency"] = analysis.get("urgency", "MEDIUM")
-                                logger.info(f"✅ Analysis loaded: {email_data.get('subject', 'Unknown')[:30]} - Priority={analysis.get('priority')}, Tone={analysis.get('tone')}, Urgency={analysis.get('urgency')}")
-                            else:
-                                simple_email["priority"] = "MEDIUM"
-                                simple_email["tone"] = "PROFESSIONAL" 
-                                simple_email["urgency"] = "MEDIUM"
-                                logger.info(f"⚠️ No analysis for: {email_data.get('subject', 'Unknown')[:30]}")
+                            if self._attach_analysis_defaults(simple_email):
+                                analyzed_count += 1
+                                if debug_enabled:
+                                    logger.debug("Analysis loaded: %s - Priority=%s, Tone=%s, Urgency=%s",
+                                                 str(simple_email["subject"])[:30], simple_email["priority"],
+                                                 simple_email["tone"], simple_email["urgency"])
+                            elif debug_enabled:
+                                logger.debug("No analysis for: %s", str(simple_email["subject"])[:30])
                             
                             formatted_batch.append(simple_email)
                             
@@ -1444,43 +1730,46 @@ class WSMessageHandler:
                             logger.error(f"❌ Failed to process email: {e}")
                             continue
                     
-                    # Send batch to frontend
+                    # Send batch to frontend, with its progress update in the same frame
                     try:
-                        await manager.send_to_client(
-                            self.websocket,
-                            "email:batch_loaded",
-                            {
-                                "emails": formatted_batch,
-                                "batch_start": batch_start,
-                                "batch_end": batch_end,
-                                "is_final": batch_end >= total_emails
-                            }
-                        )
-                        logger.info(f"📧 Sent batch {batch_start}-{batch_end} ({len(formatted_batch)} emails)")
-                        
-                        # Send progress update
-                        await manager.send_to_client(
-                            self.websocket,
-                            "email:load_progress",
-                            {
+                        batch_message = {
+                            "emails": formatted_batch,
+                            "batch_start": batch_start,
+                            "batch_end": batch_end,
+                            "is_final": batch_end >= total_emails,
+                            "progress": {
                                 "status": "loading",
                                 "current": batch_end,
                                 "total": total_emails,
                                 "message": f"Loaded {batch_end}/{total_emails} emails..."
                             }
-                        )
+                        }
+                        if coalesce:
+                            outbox.append(("email:batch_loaded", batch_message))
+                        else:
+                            if send_task:
+                                await send_task  # keep batches in order
+                            send_task = asyncio.create_task(
+                                manager.send_to_client(self.websocket, "email:batch_loaded", batch_message)
+                            )
+                            # Let the send start its write; if the socket has to drain, the next
+                            # batch gets formatted in the meantime
+                            await asyncio.sleep(0)
+                        logger.info("📧 Sent batch %d-%d: %d with analysis, %d without",
+                                    batch_start, batch_end, analyzed_count, len(formatted_batch) - analyzed_count)
                         
-                        # Small delay to show progressive loading (can be removed in production)
-                        import asyncio
-                        await asyncio.sleep(0.2)
+                        if batch_delay and batch_end < total_emails:
+                            await asyncio.sleep(batch_delay)
                         
                     except Exception as e:
                         logger.error(f"❌ Failed to send email batch: {e}")
                         break
                 
+                if send_task:
+                    await send_task
+                
                 # Send completion message
-                await manager.send_to_client(
-                    self.websocket,
+                await emit(
                     "email:load_progress",
                     {
                         "status": "completed",
@@ -1489,6 +1778,7 @@ class WSMessageHandler:
                         "message": f"Loaded all {total_emails} emails successfully"
                     }
                 )
+                await manager.send_many_to_client(self.websocket, outbox)
                 logger.info(f"✅ Completed loading {total_emails} emails in batches")
                 
             else:
@@ -1504,6 +1794,9 @@ class WSMessageHandler:
                 )
                 
         except Exception as e:
+            # Only a COM failure means the Outlook connection may be dead
+            if isinstance(e, COMError):
+                cos_orchestrator.email_triage.com_service.reset_connection()
             logger.error(f"Error getting recent emails: {e}")
             await manager.send_to_client(
                 self.websocket,
@@ -1511,6 +1804,17 @@ class WSMessageHandler:
                 {"message": f"Failed to get recent emails: {str(e)}"}
             )
 
+    @staticmethod
+    def _attach_analysis_defaults(email: Dict[str, Any]) -> bool:
+        """Copy priority/tone/urgency from the email's analysis, or defaults; True if it had analysis"""
+        analysis = email.get("analysis")
+        if analysis and isinstance(analysis, dict):
+            for key, default in EMAIL_ANALYSIS_DEFAULTS.items():
+                email[key] = analysis.get(key, default)
+            return True
+        email.update(EMAIL_ANALYSIS_DEFAULTS)
+        return False
+
     async def _find_best_project_for_task(self, email_data, task_data, all_areas, all_projects, session):
         """Use AI to find the best matching project for a task based on email content and context"""
         try:
@@ -1606,30 +1910,54 @@ Best matching project name:"""
             return None
 
 
+    # Event -> handler table, resolved once when the class is defined
+    EVENT_HANDLERS = {
+        "thread:send": handle_thread_send,
+        "email:apply_action": handle_email_action,
+        "interview:answer": handle_interview_answer,
+        "interview:dismiss": handle_interview_dismiss,
+        "project:create": handle_project_create,
+        "project:load_dashboard": handle_load_dashboard,
+        "project:insight_action": handle_insight_action,
+        "task:create": handle_task_create,
+        "task:update": handle_task_update,
+        "email:analyze": handle_email_analyze,
+        "email:get_recent": handle_get_recent_emails,
+        "email:selected": handle_email_selected,
+        "email:get_body": handle_email_get_body,
+        "email_recommendation_action": handle_email_recommendation_action,
+        "status:request": handle_status_request,
+    }
+
+
 @app.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket, db: Session = Depends(get_db)):
+async def websocket_endpoint(websocket: WebSocket, db: Session = Depends(get_worker_db)):
     """Main WebSocket endpoint for real-time communication"""
     logger.info("=== NEW WEBSOCKET CONNECTION ATTEMPT ===")
     connection_id = await manager.connect(websocket)
-    logger.info(f"WebSocket connected with ID: {connection_id}")
+    logger.info(f"WebSocket connected with ID: {connection_id:x}")
     handler = WSMessageHandler(websocket, db)
     logger.info("WebSocket handler created successfully")
     
     try:
         while True:
-            # Receive message
-            data = await websocket.receive_text()
-            logger.info(f"Received WebSocket message: {data}")
+            # Receive message (text or binary frame)
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(frame.get("code", 1000))
+            data = frame.get("bytes") or frame.get("text") or ""
+            # Raw frames can be large; only format them when debugging
+            logger.debug("Received WebSocket message: %s", data)
             
             try:
-                message = json.loads(data)
+                message = orjson.loads(data)
                 event = message.get("event")
                 msg_data = message.get("data", {})
                 
                 if event:
                     await handler.handle_message(event, msg_data)
                     
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 logger.error(f"Invalid JSON received: {data}")
                 
     except WebSocketDisconnect:
@@ -1643,32 +1971,40 @@ async def websocket_endpoint(websocket: WebSocket, db: Session = Depends(get_db)
 @app.get("/api/projects")
 async def get_projects(db: Session = Depends(get_db)):
     """Get all projects with optimized query"""
-    projects = db.query(Project).options(
-        # Only load needed columns to reduce memory
-    ).all()
-    return [{"id": p.id, "name": p.name, "status": p.status} for p in projects]
+    # Column-only query: plain rows, no ORM objects or identity map entries
+    rows = db.query(Project.id, Project.name, Project.status).all()
+    return [dict(row._mapping) for row in rows]
 
 @app.get("/api/projects/{project_id}/tasks")
 async def get_project_tasks(project_id: str, db: Session = Depends(get_db)):
     """Get tasks for a project with index optimization"""
-    tasks = db.query(Task).filter(
+    rows = db.query(Task.id, Task.title, Task.status).filter(
         Task.project_id == project_id
     ).order_by(Task.created_at.desc()).all()
-    return [{"id": t.id, "title": t.title, "status": t.status} for t in tasks]
+    return [dict(row._mapping) for row in rows]
 
 # ===== PROJECT MANAGEMENT API ENDPOINTS =====
 
 @app.get("/api/areas")
 async def get_areas(db: Session = Depends(get_db)):
     """Get all areas with project and task counts"""
+    # Per-area counts in one grouped query each; only active projects (exclude archived)
+    project_counts = dict(
+        db.query(Project.area_id, func.count(Project.id))
+        .filter(Project.status != 'archived')
+        .group_by(Project.area_id).all()
+    )
+    task_counts = dict(
+        db.query(Project.area_id, func.count(Task.id))
+        .join(Task, Task.project_id == Project.id)
+        .group_by(Project.area_id).all()
+    )
+    
     areas = []
-    for area in db.query(Area).order_by(Area.sort_order).all():
-        # Count only active projects (exclude archived)
-        project_count = db.query(Project).filter(
-            Project.area_id == area.id,
-            Project.status != 'archived'
-        ).count()
-        task_count = db.query(Task).join(Project).filter(Project.area_id == area.id).count()
+    for area in db.query(
+        Area.id, Area.name, Area.description, Area.color,
+        Area.is_default, Area.is_system, Area.sort_order, Area.created_at
+    ).order_by(Area.sort_order).all():
         areas.append({
             "id": area.id,
             "name": area.name,
@@ -1677,8 +2013,8 @@ async def get_areas(db: Session = Depends(get_db)):
             "is_default": area.is_default,
             "is_system": area.is_system,
             "sort_order": area.sort_order,
-            "project_count": project_count,
-            "task_count": task_count,
+            "project_count": project_counts.get(area.id, 0),
+            "task_count": task_counts.get(area.id, 0),
             "created_at": area.created_at.isoformat() if area.created_at else None
         })
     return areas
@@ -1803,16 +2139,25 @@ async def delete_area(area_id: str, db: Session = Depends(get_db)):
 @app.get("/api/areas/{area_id}/projects")
 async def get_area_projects(area_id: str, db: Session = Depends(get_db)):
     """Get all projects in an area with task counts"""
+    # All three task counts for every project in the area, in one grouped query
+    task_counts = {
+        row.project_id: row
+        for row in db.query(
+            Task.project_id,
+            func.count(Task.id).label("task_count"),
+            func.sum(case((Task.status == "completed", 1), else_=0)).label("completed_count"),
+            func.sum(case((and_(Task.due_date < utc_now(), Task.status != "completed"), 1), else_=0)).label("overdue_count"),
+        ).join(Project, Task.project_id == Project.id)
+        .filter(Project.area_id == area_id)
+        .group_by(Task.project_id).all()
+    }
+    
     projects = []
-    for project in db.query(Project).filter_by(area_id=area_id).order_by(Project.sort_order).all():
-        task_count = db.query(Task).filter_by(project_id=project.id).count()
-        completed_count = db.query(Task).filter_by(project_id=project.id, status="completed").count()
-        overdue_count = db.query(Task).filter(
-            Task.project_id == project.id,
-            Task.due_date < utc_now(),
-            Task.status != "completed"
-        ).count()
-        
+    for project in db.query(
+        Project.id, Project.name, Project.description, Project.status, Project.priority,
+        Project.is_catch_all, Project.is_system, Project.color, Project.created_at
+    ).filter(Project.area_id == area_id).order_by(Project.sort_order).all():
+        counts = task_counts.get(project.id)
         projects.append({
             "id": project.id,
             "name": project.name,
@@ -1822,9 +2167,9 @@ async def get_area_projects(area_id: str, db: Session = Depends(get_db)):
             "is_catch_all": project.is_catch_all,
             "is_system": project.is_system,
             "color": project.color,
-            "task_count": task_count,
-            "completed_count": completed_count,
-            "overdue_count": overdue_count,
+            "task_count": counts.task_count if counts else 0,
+            "completed_count": counts.completed_count if counts else 0,
+            "overdue_count": counts.overdue_count if counts else 0,
             "created_at": project.created_at.isoformat() if project.created_at else None
         })
     return projects
@@ -1838,8 +2183,13 @@ async def create_project(project_data: dict, db: Session = Depends(get_db)):
         
         # Auto-rename logic for duplicate names within the same area
         def generate_unique_project_name(base_name: str, area_id: str) -> str:
-            existing_projects = db.query(Project).filter(Project.area_id == area_id).all()
-            existing_names = [p.name.lower() for p in existing_projects]
+            # Only names that could collide: the base name itself or "<base name> N"
+            existing_names = {
+                name.lower() for (name,) in db.query(Project.name).filter(
+                    Project.area_id == area_id,
+                    func.lower(Project.name).startswith(base_name.lower(), autoescape=True)
+                ).all()
+            }
             
             unique_name = base_name
             if unique_name.lower() not in existing_names:
@@ -1881,12 +2231,19 @@ async def create_project(project_data: dict, db: Session = Depends(get_db)):
 @app.get("/api/projects/{project_id}")
 async def get_project_detail(project_id: str, db: Session = Depends(get_db)):
     """Get detailed project info with tasks"""
-    project = db.query(Project).filter_by(id=project_id).first()
+    project = db.query(
+        Project.id, Project.name, Project.description, Project.status, Project.priority,
+        Project.is_catch_all, Project.color,
+        Area.id.label("area_id"), Area.name.label("area_name"), Area.color.label("area_color")
+    ).join(Area, Project.area_id == Area.id).filter(Project.id == project_id).first()
     if not project:
         return {"success": False, "error": "Project not found"}
     
     tasks = []
-    for task in db.query(Task).filter_by(project_id=project_id).order_by(Task.created_at.desc()).all():
+    for task in db.query(
+        Task.id, Task.title, Task.objective, Task.status, Task.priority, Task.due_date,
+        Task.sponsor_email, Task.owner_email, Task.created_at, Task.completed_at
+    ).filter(Task.project_id == project_id).order_by(Task.created_at.desc()).all():
         tasks.append({
             "id": task.id,
             "title": task.title,
@@ -1911,9 +2268,9 @@ async def get_project_detail(project_id: str, db: Session = Depends(get_db)):
             "is_catch_all": project.is_catch_all,
             "color": project.color,
             "area": {
-                "id": project.area.id,
-                "name": project.area.name,
-                "color": project.area.color
+                "id": project.area_id,
+                "name": project.area_name,
+                "color": project.area_color
             }
         },
         "tasks": tasks
@@ -1929,7 +2286,7 @@ async def create_task(task_data: dict, db: Session = Depends(get_db)):
             project_id=task_data["project_id"],
             status=task_data.get("status", "not_started"),
             priority=task_data.get("priority", 3),
-            due_date=datetime.fromisoformat(task_data["due_date"]) if task_data.get("due_date") else None,
+            due_date=parse_fromisoformat(task_data["due_date"]) if task_data.get("due_date") else None,
             sponsor_email=task_data.get("sponsor_email"),
             owner_email=task_data.get("owner_email"),
             parent_task_id=task_data.get("parent_task_id")
@@ -1964,13 +2321,13 @@ async def update_task(task_id: str, task_data: dict, db: Session = Depends(get_d
         # Update fields
         for field, value in task_data.items():
             if field == "due_date" and value:
-                setattr(task, field, datetime.fromisoformat(value))
+                setattr(task, field, parse_fromisoformat(value))
                 logger.info(f"Updated {field}: {value}")
             elif field == "completed_at" and value:
-                setattr(task, field, datetime.fromisoformat(value))
+                setattr(task, field, parse_fromisoformat(value))
                 logger.info(f"Updated {field}: {value}")
             elif field == "created_at" and value and isinstance(value, str):
-                setattr(task, field, datetime.fromisoformat(value))
+                setattr(task, field, parse_fromisoformat(value))
                 logger.info(f"Updated {field}: {value}")
             elif hasattr(task, field) and field not in ["created_at"]:  # Skip created_at since it's handled above
                 setattr(task, field, value)
@@ -2078,16 +2435,12 @@ async def archive_project(project_id: str, db: Session = Depends(get_db)):
         if project.is_system:
             return {"success": False, "error": "Cannot archive system projects"}
         
-        # Update all active tasks to blocked status before archiving project
-        active_tasks = db.query(Task).filter(
+        # Update all active tasks to blocked status before archiving project, in one UPDATE.
+        # Completed counts don't change, so the project task counters stay correct
+        blocked_tasks_count = db.query(Task).filter(
             Task.project_id == project_id,
             Task.status == 'active'
-        ).all()
-        
-        blocked_tasks_count = 0
-        for task in active_tasks:
-            task.status = 'blocked'
-            blocked_tasks_count += 1
+        ).update({Task.status: 'blocked'}, synchronize_session=False)
         
         # Archive the project
         project.status = "archived"
@@ -2117,6 +2470,15 @@ async def restore_project(project_id: str, db: Session = Depends(get_db)):
         db.rollback()
         return {"success": False, "error": str(e)}
 
+def project_task_counts(db: Session, project_id: str) -> Tuple[int, int]:
+    """Direct tasks of a project and subtasks of those tasks, in one round trip of scalar subqueries"""
+    project_task_ids = select(Task.id).where(Task.project_id == project_id)
+    task_count, subtask_count = db.execute(select(
+        select(func.count(Task.id)).where(Task.project_id == project_id).scalar_subquery(),
+        select(func.count(Task.id)).where(Task.parent_task_id.in_(project_task_ids)).scalar_subquery()
+    )).one()
+    return task_count, subtask_count
+
 @app.get("/api/projects/{project_id}/deletion-info")
 async def get_project_deletion_info(project_id: str, db: Session = Depends(get_db)):
     """Get information about what will be deleted with this project"""
@@ -2125,15 +2487,7 @@ async def get_project_deletion_info(project_id: str, db: Session = Depends(get_d
         if not project:
             return {"success": False, "error": "Project not found"}
         
-        # Count direct tasks of this project
-        project_tasks = db.query(Task).filter_by(project_id=project_id).all()
-        task_count = len(project_tasks)
-        
-        # Count subtasks that belong to tasks of this project
-        subtask_count = 0
-        for task in project_tasks:
-            subtask_count += db.query(Task).filter_by(parent_task_id=task.id).count()
-        
+        task_count, subtask_count = project_task_counts(db, project_id)
         total_task_count = task_count + subtask_count
         
         return {
@@ -2161,17 +2515,25 @@ async def delete_project(project_id: str, db: Session = Depends(get_db)):
             return {"success": False, "error": "Project must be archived before deletion"}
         
         # Get task information for frontend warning (but allow cascade deletion)
-        # Count direct tasks of this project
-        project_tasks = db.query(Task).filter_by(project_id=project_id).all()
-        task_count = len(project_tasks)
-        
-        # Count subtasks that belong to tasks of this project
-        subtask_count = 0
-        for task in project_tasks:
-            subtask_count += db.query(Task).filter_by(parent_task_id=task.id).count()
-        
+        task_count, subtask_count = project_task_counts(db, project_id)
         total_task_count = task_count + subtask_count
         
+        # Remove the project's tasks and their subtask trees in one DELETE rather than
+        # letting the ORM cascade load and delete them row by row
+        doomed = select(Task.id).where(Task.project_id == project_id).cte("doomed_tasks", recursive=True)
+        doomed = doomed.union(select(Task.id).where(Task.parent_task_id == doomed.c.id))
+        doomed_ids = select(doomed.c.id)
+        
+        # Subtasks filed under other projects still count there; keep those counters in step
+        connection = db.connection()
+        for other_project_id, total, completed in db.query(
+            Task.project_id,
+            func.count(Task.id),
+            func.sum(case((Task.status == "completed", 1), else_=0))
+        ).filter(Task.id.in_(doomed_ids), Task.project_id != project_id).group_by(Task.project_id):
+            adjust_project_task_counts(connection, other_project_id, -total, -completed)
+        
+        db.execute(delete(Task).where(Task.id.in_(doomed_ids)), execution_options={"synchronize_session": False})
         db.delete(project)
         db.commit()
         return {"success": True, "task_count": task_count, "subtask_count": subtask_count, "total_task_count": total_task_count}
@@ -2209,32 +2571,23 @@ async def get_job_status(job_id: str, db: Session = Depends(get_db)):
 @app.get("/debug/prompts")
 async def debug_prompts():
     """Debug endpoint to show loaded prompts and their timestamps"""
-    prompt_info = {}
-    for key, content in claude_client.prompts_cache.items():
-        # Extract timestamp from content
-        lines = content.split('\n')
-        if lines[0].startswith('<!-- Last saved:'):
-            timestamp = lines[0].replace('<!-- Last saved:', '').replace(' -->', '').strip()
-            preview = lines[1][:100] + "..." if len(lines) > 1 else ""
-        else:
-            timestamp = "Unknown"
-            preview = content[:100] + "..."
-        
-        prompt_info[key] = {
-            "last_saved": timestamp,
-            "preview": preview,
-            "size": len(content)
-        }
+    # Metadata is parsed once when the prompts are loaded
+    prompt_info = dict(claude_client.prompts_meta)
     
     return {
         "total_prompts": len(prompt_info),
         "prompts": prompt_info
     }
 
+@functools.lru_cache(maxsize=1)
+def _health_payload(second: int) -> Dict[str, str]:
+    """Health payload for one wall-clock second, so frequent probes reuse it"""
+    return {"status": "healthy", "timestamp": utc_timestamp()}
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "timestamp": utc_timestamp()}
+    return _health_payload(int(time.time()))
 
 @app.get("/api/usage/stats")
 async def get_usage_stats():
@@ -2246,48 +2599,41 @@ async def reset_usage_stats():
     """Reset AI usage statistics (admin only)"""
     return claude_client.reset_usage_stats()
 
-# OAuth callback endpoint for Outlook integration
-@app.get("/auth/callback")
-async def oauth_callback(request: Request, code: str = None, state: str = None, error: str = None):
-    """Handle OAuth2 callback from Microsoft"""
-    if error:
-        return HTMLResponse(f"""
+@functools.lru_cache(maxsize=None)
+def get_auth_manager():
+    """Shared OutlookAuthManager, built on first use instead of per request.
+    Raises ImportError while the Graph OAuth module isn't installed."""
+    from integrations.outlook.auth import OutlookAuthManager
+    return OutlookAuthManager()
+
+# Static OAuth callback pages (Response objects aren't shared: middleware may add headers in place)
+OAUTH_INVALID_REQUEST_HTML = """
         <html>
-            <head><title>Authorization Error</title></head>
+            <head><title>Invalid Request</title></head>
             <body>
-                <h1>Authorization Failed</h1>
-                <p>Error: {error}</p>
-                <p>Please try again or check your app configuration.</p>
+                <h1>Invalid Authorization Request</h1>
+                <p>Missing authorization code or state parameter.</p>
                 <script>
                     setTimeout(() => window.close(), 3000);
                 </script>
             </body>
         </html>
-        """)
-    
-    if not code or not state:
-        return HTMLResponse("""
+        """
+# {error} must be HTML-escaped by the caller; it echoes request parameters and exception text
+OAUTH_ERROR_HTML = """
         <html>
-            <head><title>Invalid Request</title></head>
+            <head><title>Authorization Error</title></head>
             <body>
-                <h1>Invalid Authorization Request</h1>
-                <p>Missing authorization code or state parameter.</p>
+                <h1>Authorization Failed</h1>
+                <p>{error}</p>
+                <p>{hint}</p>
                 <script>
                     setTimeout(() => window.close(), 3000);
                 </script>
             </body>
         </html>
-        """)
-    
-    try:
-        # Exchange authorization code for token
-        from integrations.outlook.auth import OutlookAuthManager
-        auth_manager = OutlookAuthManager()
-        
-        logger.info(f"OAuth callback - code: {code[:20]}..., state: {state}")
-        token_data = await auth_manager.exchange_code_for_token(code, state)
-        
-        return HTMLResponse("""
+        """
+OAUTH_SUCCESS_HTML = """
         <html>
             <head><title>Authorization Successful</title></head>
             <body>
@@ -2299,30 +2645,42 @@ async def oauth_callback(request: Request, code: str = None, state: str = None,
                 </script>
             </body>
         </html>
-        """)
+        """
+
+# OAuth callback endpoint for Outlook integration
+@app.get("/auth/callback")
+async def oauth_callback(request: Request, code: str = None, state: str = None, error: str = None):
+    """Handle OAuth2 callback from Microsoft"""
+    if error:
+        return HTMLResponse(OAUTH_ERROR_HTML.format(
+            error=html.escape(f"Error: {error}"),
+            hint="Please try again or check your app configuration."
+        ))
+    
+    if not code or not state:
+        return HTMLResponse(OAUTH_INVALID_REQUEST_HTML)
+    
+    try:
+        # Exchange authorization code for token
+        auth_manager = get_auth_manager()
+        
+        logger.info(f"OAuth callback - code: {code[:20]}..., state: {state}")
+        token_data = await auth_manager.exchange_code_for_token(code, state)
+        
+        return HTMLResponse(OAUTH_SUCCESS_HTML)
         
     except Exception as e:
         logger.error(f"OAuth callback error: {e}")
-        return HTMLResponse(f"""
-        <html>
-            <head><title>Authorization Error</title></head>
-            <body>
-                <h1>Authorization Failed</h1>
-                <p>Error exchanging authorization code: {str(e)}</p>
-                <p>Please try again or check your configuration.</p>
-                <script>
-                    setTimeout(() => window.close(), 3000);
-                </script>
-            </body>
-        </html>
-        """)
+        return HTMLResponse(OAUTH_ERROR_HTML.format(
+            error=html.escape(f"Error exchanging authorization code: {e}"),
+            hint="Please try again or check your configuration."
+        ))
 
 @app.get("/auth/status")
 async def auth_status():
     """Check Outlook authentication status"""
     try:
-        from integrations.outlook.auth import OutlookAuthManager
-        auth_manager = OutlookAuthManager()
+        auth_manager = get_auth_manager()
         
         if auth_manager.is_authenticated():
             token_info = auth_manager.get_token_info()
@@ -2343,4 +2701,5 @@ async def auth_status():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("app:app", host="127.0.0.1", port=8787, reload=True)
\ No newline at end of file
+    # permessage-deflate: email batches are mostly body text and compress well
+    uvicorn.run("app:app", host="127.0.0.1", port=8787, reload=True, ws_per_message_deflate=True)
\ No newline at end of file
@@ -3,15 +3,18 @@ Claude AI client with prompt loading from llm/prompts directory.
 Handles all AI interactions for the Chief of Staff system.
 """
 import os
+import re
+import random
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 import asyncio
 import time
-from functools import lru_cache
 import hashlib
 from datetime import datetime, timedelta
 import threading
+from collections import OrderedDict
+import orjson
 from anthropic import AsyncAnthropic
 from dotenv import load_dotenv
 
@@ -20,15 +23,41 @@ logger = logging.getLogger(__name__)
 class ClaudeClient:
     """Claude AI client with prompt management and rate limiting"""
     
+    _MOCK_INTERVIEW_QUESTIONS = (
+        "What's your biggest priority for this week?",
+        "Which project would benefit most from additional focus?",
+        "Are there any decisions you're waiting on from others?",
+        "What information would help you work more effectively?"
+    )
+    
+    # Slash command in a mock CoS request, matched case-insensitively in one scan
+    _CMD_RE = re.compile(r'/(plan|summarize|triage)', re.IGNORECASE)
+    
+    # Mock builders that take only the context, by prompt key ("system/cos" also needs the input)
+    _MOCK_CONTEXT_RESPONSES = {
+        "system/emailtriage": "_mock_email_triage_response",
+        "system/summarizer": "_mock_summarizer_response",
+        "system/writer": "_mock_writer_response",
+        "tools/interview": "_mock_interview_response",
+        "tools/digest": "_mock_digest_response",
+    }
+    
+    # Whole-word action verbs for extract_tasks_from_text ("prepared" is not "prepare")
+    _ACTION_RE = re.compile(r'\b(?:review|schedule|update|prepare|send|call|meet|analyze)\b', re.IGNORECASE)
+    
     def __init__(self):
         # Ensure .env file is loaded for API key
         load_dotenv()
         self.api_key = os.getenv("ANTHROPIC_API_KEY")
+        self.use_mock_responses = os.getenv("USE_MOCK_RESPONSES", "").lower() == "true"
         self.prompts_cache: Dict[str, str] = {}
+        self.prompts_meta: Dict[str, Dict[str, Any]] = {}  # last_saved/preview/size per prompt, for /debug/prompts
+        self._prompt_files: Dict[str, Tuple[str, float]] = {}  # prompt_key -> (path, mtime) as loaded
         self.prompts_dir = Path(__file__).parent.parent / "llm" / "prompts"
         
-        # Response cache with TTL
-        self.response_cache: Dict[str, Dict[str, Any]] = {}
+        # Response cache with TTL, kept in least-recently-used order
+        self.response_cache: "OrderedDict[bytes, Tuple[float, Any]]" = OrderedDict()  # key -> (expires_at, response)
+        self.response_cache_max = 1000
         self.cache_ttl = 300  # 5 minutes cache TTL
         
         # Rate limiting for API calls
@@ -52,13 +81,18 @@ class ClaudeClient:
             'call_history': []  # Last 20 calls with details
         }
         
+        # Delay added to mock responses, for exercising loading states; off unless configured
+        self.mock_latency = float(os.getenv("MOCK_CLAUDE_LATENCY_MS", "0")) / 1000
+        
         # Callback for usage updates (to be set by app.py)
         self.usage_update_callback = None
         
         # Initialize Anthropic client
         self.client = AsyncAnthropic(api_key=self.api_key) if self.api_key else None
         
-        # Load all prompts on initialization
+        # Load all prompts on initialization; with COS_PROMPT_WATCH set, edited prompt files are
+        # picked up on next use (one stat of that file per call)
+        self.prompt_watch = bool(os.getenv("COS_PROMPT_WATCH"))
         self._load_all_prompts()
         logger.info(f"Loaded {len(self.prompts_cache)} prompts")
     
@@ -68,42 +102,67 @@ class ClaudeClient:
             logger.error(f"Prompts directory not found: {self.prompts_dir}")
             raise FileNotFoundError(f"Prompts directory not found: {self.prompts_dir}")
         
-        prompt_files = list(self.prompts_dir.glob("**/*.md"))
-        
-        for prompt_file in prompt_files:
+        for entry in self._walk_prompt_files(self.prompts_dir):
             # Create key from relative path (e.g., "system/cos.md" -> "system/cos")
-            relative_path = prompt_file.relative_to(self.prompts_dir)
-            prompt_key = str(relative_path).replace(".md", "").replace("\\", "/")
+            relative_path = os.path.relpath(entry.path, self.prompts_dir)
+            prompt_key = relative_path.replace(".md", "").replace("\\", "/")
             
             try:
-                # Get file modification time
-                mod_time = prompt_file.stat().st_mtime
-                mod_datetime = datetime.fromtimestamp(mod_time)
-                
-                with open(prompt_file, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                    # Add timestamp header to content
-                    timestamp_str = mod_datetime.strftime('%Y-%m-%d %H:%M:%S')
-                    timestamped_content = f"<!-- Last saved: {timestamp_str} -->\n{content}"
-                    self.prompts_cache[prompt_key] = timestamped_content
-                    
-                    logger.info(f"Loaded prompt '{prompt_key}' (saved: {timestamp_str})")
-                    
+                # Get file modification time (DirEntry caches its stat; free on Windows)
+                self._load_prompt_file(prompt_key, entry.path, entry.stat().st_mtime)
             except Exception as e:
-                logger.error(f"Failed to load prompt {prompt_file}: {e}")
+                logger.error(f"Failed to load prompt {entry.path}: {e}")
         
         logger.info(f"Loaded {len(self.prompts_cache)} prompts")
     
-    # @lru_cache(maxsize=128)  # Temporarily disabled for debugging
+    def _load_prompt_file(self, prompt_key: str, path: str, mtime: float):
+        """Read one prompt file into the cache, stamped with its modification time"""
+        content = Path(path).read_text(encoding='utf-8').strip()
+        # Add timestamp header to content
+        timestamp_str = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S')
+        timestamped_content = f"<!-- Last saved: {timestamp_str} -->\n{content}"
+        self.prompts_cache[prompt_key] = timestamped_content
+        self.prompts_meta[prompt_key] = {
+            "last_saved": timestamp_str,
+            "preview": content.partition('\n')[0][:100] + "...",
+            "size": len(timestamped_content)
+        }
+        self._prompt_files[prompt_key] = (path, mtime)
+        
+        logger.info(f"Loaded prompt '{prompt_key}' (saved: {timestamp_str})")
+    
+    @staticmethod
+    def _walk_prompt_files(path):
+        """Yield DirEntry objects for every .md file under path, via os.scandir"""
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    yield from ClaudeClient._walk_prompt_files(entry.path)
+                elif entry.name.endswith(".md") and entry.is_file():
+                    yield entry
+    
     def get_prompt(self, prompt_key: str) -> str:
         """Get a prompt by key (e.g., 'system/cos' or 'tools/digest')"""
-        # Force reload prompts to pick up changes during debugging
-        self._load_all_prompts()
+        if self.prompt_watch:
+            self._refresh_prompt(prompt_key)
         
-        if prompt_key not in self.prompts_cache:
+        try:
+            return self.prompts_cache[prompt_key]
+        except KeyError:
             raise ValueError(f"Prompt not found: {prompt_key}. Available prompts: {list(self.prompts_cache.keys())}")
-        
-        return self.prompts_cache[prompt_key]
+    
+    def _refresh_prompt(self, prompt_key: str):
+        """Re-read one prompt if its file changed; rescan the directory for a key not seen yet"""
+        if prompt_key not in self._prompt_files:
+            self._load_all_prompts()
+            return
+        path, loaded_mtime = self._prompt_files[prompt_key]
+        try:
+            mtime = os.stat(path).st_mtime
+            if mtime != loaded_mtime:
+                self._load_prompt_file(prompt_key, path, mtime)
+        except OSError as e:
+            logger.error(f"Failed to reload prompt {path}: {e}")
     
     def update_activity(self):
         """Update the last activity time to track user interaction"""
@@ -157,7 +216,7 @@ class ClaudeClient:
             logger.info(f"Using prompt for {prompt_key}: {system_prompt[:100]}...")
             
             # Use real Claude API if key available, otherwise fallback to mock
-            if self.api_key and not os.getenv("USE_MOCK_RESPONSES", "").lower() == "true":
+            if self.api_key and not self.use_mock_responses:
                 # Apply rate limiting before API call
                 await self._apply_rate_limiting()
                 logger.info(f"Calling Claude API with user input: {user_input}")
@@ -182,38 +241,46 @@ class ClaudeClient:
             logger.error(f"Error generating response with prompt {prompt_key}: {e}")
             return f"Error: Could not generate response. {str(e)}"
     
-    def _create_cache_key(self, prompt_key: str, context: Dict[str, Any], user_input: str) -> str:
+    def _create_cache_key(self, prompt_key: str, context: Dict[str, Any], user_input: str) -> bytes:
         """Create a cache key from the inputs"""
-        # Create deterministic hash from inputs
-        content = f"{prompt_key}:{context or ''}:{user_input}"
-        return hashlib.md5(content.encode()).hexdigest()
+        # Cache keys only need to be well distributed, so use BLAKE2b rather than MD5,
+        # fed piecewise with separators instead of building one joined string. The raw
+        # 8-byte digest is plenty for a cache of response_cache_max entries
+        hasher = hashlib.blake2b(digest_size=8)
+        hasher.update(prompt_key.encode())
+        hasher.update(b"\0")
+        # Canonical context: the same dict built in a different order must hit the same entry.
+        # Nothing to serialize for the common no-context call
+        if context:
+            hasher.update(orjson.dumps(context, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS))
+        hasher.update(b"\0")
+        hasher.update(user_input.encode())
+        return hasher.digest()
     
-    def _get_cached_response(self, cache_key: str) -> Optional[str]:
-        """Get cached response if still valid"""
-        if cache_key not in self.response_cache:
+    def _get_cached_response(self, cache_key: bytes) -> Optional[Any]:
+        """Get cached response (a string, or a structured result) if still valid"""
+        cached = self.response_cache.get(cache_key)
+        if cached is None:
             return None
-            
-        cached = self.response_cache[cache_key]
-        if time.time() - cached['timestamp'] > self.cache_ttl:
+        
+        expires_at, response = cached
+        if time.monotonic() > expires_at:
             # Cache expired
             del self.response_cache[cache_key]
             return None
-            
-        return cached['response']
-    
-    def _cache_response(self, cache_key: str, response: str):
-        """Cache a response with timestamp"""
-        self.response_cache[cache_key] = {
-            'response': response,
-            'timestamp': time.time()
-        }
         
-        # Clean up old cache entries (simple cleanup)
-        if len(self.response_cache) > 1000:
-            # Remove oldest 100 entries
-            sorted_items = sorted(self.response_cache.items(), key=lambda x: x[1]['timestamp'])
-            for key, _ in sorted_items[:100]:
-                del self.response_cache[key]
+        self.response_cache.move_to_end(cache_key)
+        return response
+    
+    def _cache_response(self, cache_key: bytes, response: Any):
+        """Cache a response with timestamp; structured results are stored as-is, not as JSON"""
+        # Expiry on the monotonic clock, so wall-clock adjustments don't age or revive entries
+        self.response_cache[cache_key] = (time.monotonic() + self.cache_ttl, response)
+        self.response_cache.move_to_end(cache_key)
+        
+        # Evict least recently used entries beyond the cap
+        while len(self.response_cache) > self.response_cache_max:
+            self.response_cache.popitem(last=False)
     
     async def _call_claude_api(self, system_prompt: str, context: Dict[str, Any], user_input: str) -> tuple[str, int, int]:
         """Make actual API call to Claude and return response with token counts"""
@@ -253,32 +320,30 @@ class ClaudeClient:
         if not context:
             return ""
         
-        formatted_parts = []
-        for key, value in context.items():
-            if value is not None:
-                formatted_parts.append(f"{key}: {value}")
-        
-        return "\n".join(formatted_parts)
+        return "\n".join([f"{key}: {value}" for key, value in context.items() if value is not None])
+    
+    async def _simulate_latency(self):
+        """Optional artificial delay for mock responses (MOCK_CLAUDE_LATENCY_MS, default off)"""
+        if self.mock_latency:
+            await asyncio.sleep(self.mock_latency)
     
     async def _mock_claude_response(self, prompt_key: str, context: Dict[str, Any], user_input: str) -> str:
         """Mock Claude responses for development with reduced delay"""
-        # Simulate API delay (reduced for better performance)
-        await asyncio.sleep(0.2)
-        
-        mock_responses = {
-            "system/cos": self._mock_cos_response(user_input, context),
-            "system/emailtriage": self._mock_email_triage_response(context),
-            "system/summarizer": self._mock_summarizer_response(context),
-            "system/writer": self._mock_writer_response(context),
-            "tools/interview": self._mock_interview_response(context),
-            "tools/digest": self._mock_digest_response(context),
-        }
-        
-        return mock_responses.get(prompt_key, f"Mock response for {prompt_key}: {user_input}")
+        await self._simulate_latency()
+        
+        # Only build the response for the requested prompt
+        if prompt_key == "system/cos":
+            return self._mock_cos_response(user_input, context)
+        handler_name = self._MOCK_CONTEXT_RESPONSES.get(prompt_key)
+        if handler_name:
+            return getattr(self, handler_name)(context)
+        return f"Mock response for {prompt_key}: {user_input}"
     
     def _mock_cos_response(self, user_input: str, context: Dict[str, Any]) -> str:
         """Mock Chief of Staff orchestrator response"""
-        if "/plan" in user_input.lower():
+        match = self._CMD_RE.search(user_input)
+        command = match.group(1).lower() if match else None
+        if command == "plan":
             return """I'll help you plan your work. Based on your current context, here are some key areas to focus on:
 
 1. **Email Processing** - You have 3 unread emails that may need action
@@ -287,7 +352,7 @@ class ClaudeClient:
 
 Would you like me to start with email triage or conduct the context interview?"""
 
-        elif "/summarize" in user_input.lower():
+        elif command == "summarize":
             return """Here's a summary of your current work status:
 
 **Active Projects**: 3 projects in progress
@@ -302,7 +367,7 @@ Would you like me to start with email triage or conduct the context interview?""
 
 Would you like me to dive deeper into any specific area?"""
 
-        elif "/triage" in user_input.lower():
+        elif command == "triage":
             return """Starting inbox triage...
 
 **Processed 8 emails:**
@@ -381,15 +446,7 @@ Best regards,
     
     def _mock_interview_response(self, context: Dict[str, Any]) -> str:
         """Mock interview question generation"""
-        questions = [
-            "What's your biggest priority for this week?",
-            "Which project would benefit most from additional focus?",
-            "Are there any decisions you're waiting on from others?",
-            "What information would help you work more effectively?"
-        ]
-        
-        import random
-        return random.choice(questions)
+        return random.choice(self._MOCK_INTERVIEW_QUESTIONS)
     
     def _mock_digest_response(self, context: Dict[str, Any]) -> str:
         """Mock digest generation"""
@@ -418,24 +475,23 @@ Consider scheduling focused time for Project Alpha client feedback review - it's
     async def extract_tasks_from_text(self, text: str) -> List[Dict[str, Any]]:
         """Extract actionable tasks from text content with caching"""
         # Check cache first
-        cache_key = f"extract_tasks:{hashlib.md5(text.encode()).hexdigest()}"
+        cache_key = self._create_cache_key("extract_tasks", None, text)
         cached = self._get_cached_response(cache_key)
-        if cached:
-            import json
-            return json.loads(cached)
+        if cached is not None:
+            return [dict(task) for task in cached]  # callers may mutate their copy
         
-        # Mock task extraction (reduced delay)
-        await asyncio.sleep(0.1)
+        # Mock task extraction
+        await self._simulate_latency()
         
         tasks = []
-        action_words = ["review", "schedule", "update", "prepare", "send", "call", "meet", "analyze"]
         
         sentences = text.split('.')
         for sentence in sentences:
-            sentence = sentence.strip().lower()
-            if any(word in sentence for word in action_words) and len(sentence.split()) > 3:
+            # capitalize() lowercases the rest, so the sentence isn't lowercased up front;
+            # a bounded split is enough to tell whether it has more than three words
+            if self._ACTION_RE.search(sentence) and len(sentence.split(None, 4)) > 3:
                 # Extract potential task
-                task_title = sentence.capitalize()
+                task_title = sentence.strip().capitalize()
                 if len(task_title) > 100:
                     task_title = task_title[:97] + "..."
                 
@@ -448,15 +504,14 @@ Consider scheduling focused time for Project Alpha client feedback review - it's
         result = tasks[:5]  # Limit to 5 tasks
         
         # Cache the result
-        import json
-        self._cache_response(cache_key, json.dumps(result))
+        self._cache_response(cache_key, [dict(task) for task in result])
         
         return result
     
     async def suggest_project_links(self, content: str, existing_projects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Suggest which projects this content might relate to"""
         # Mock project linking
-        await asyncio.sleep(0.2)
+        await self._simulate_latency()
         
         suggestions = []
         if existing_projects:
@@ -473,7 +528,7 @@ Consider scheduling focused time for Project Alpha client feedback review - it's
     async def generate_email_summary(self, email_content: str, subject: str) -> Dict[str, Any]:
         """Generate summary and highlights for an email"""
         # Mock email summarization
-        await asyncio.sleep(0.4)
+        await self._simulate_latency()
         
         return {
             "summary": f"Email regarding {subject.lower()} with key updates and action items.",
@@ -489,7 +544,7 @@ Consider scheduling focused time for Project Alpha client feedback review - it's
     async def generate_suggestions(self, context: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate actionable suggestions based on context"""
         # Mock suggestion generation
-        await asyncio.sleep(0.3)
+        await self._simulate_latency()
         
         suggestions = [
             {
@@ -3,6 +3,7 @@ COM-based Outlook connector for direct integration with running Outlook applicat
 Fallback when Graph API/OAuth is not available.
 """
 import logging
+import threading
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 
@@ -11,17 +12,23 @@ logger = logging.getLogger(__name__)
 try:
     import win32com.client
     import pythoncom
+    COMError = pythoncom.com_error
     COM_AVAILABLE = True
 except ImportError:
     COM_AVAILABLE = False
     logger.warning("win32com not available - COM integration disabled")
 
+    class COMError(Exception):
+        """Stand-in for pywintypes.com_error when pywin32 is unavailable; never raised"""
+
 class OutlookCOMConnector:
     """Direct COM interface to running Outlook application"""
     
     def __init__(self):
         self.outlook_app = None
-        self.namespace = None
+        self._namespace = None
+        self._owner_thread = None  # thread that connect() ran on; its proxies live in that apartment
+        self._thread_local = threading.local()
         self._connected = False
         self._batch_loader = None
         
@@ -34,7 +41,9 @@ class OutlookCOMConnector:
         try:
             # Connect to existing Outlook application
             self.outlook_app = win32com.client.GetActiveObject("Outlook.Application")
-            self.namespace = self.outlook_app.GetNamespace("MAPI")
+            self._namespace = self.outlook_app.GetNamespace("MAPI")
+            self._owner_thread = threading.get_ident()
+            self._thread_local = threading.local()
             self._connected = True
             
             # USE ONLY LEGACY METHOD - No batch processing as per user requirements
@@ -48,10 +57,29 @@ class OutlookCOMConnector:
             logger.info("Make sure Outlook is running and try again")
             return False
     
+    @property
+    def namespace(self):
+        """MAPI namespace usable from the calling thread.
+        
+        COM proxies belong to the apartment that created them, so worker threads
+        (e.g. asyncio.to_thread callers) attach to Outlook with their own proxy.
+        """
+        if self._namespace is None or threading.get_ident() == self._owner_thread:
+            return self._namespace
+        local = self._thread_local
+        if getattr(local, "namespace", None) is None:
+            pythoncom.CoInitialize()
+            local.namespace = win32com.client.GetActiveObject("Outlook.Application").GetNamespace("MAPI")
+        return local.namespace
+    
     def is_connected(self) -> bool:
         """Check if connected to Outlook"""
         return self._connected and self.outlook_app is not None
     
+    def mark_disconnected(self):
+        """Flag the connection as lost; the next connect() replaces the Outlook proxies"""
+        self._connected = False
+    
     def get_folders(self) -> List[Dict[str, Any]]:
         """Get all mail folders"""
         if not self.is_connected():
@@ -122,8 +150,9 @@ class OutlookCOMConnector:
             return []
     
     
-    def _get_messages_legacy(self, folder_name: str, limit: int) -> List[Dict[str, Any]]:
-        """Legacy message loading method (synchronous fallback)"""
+    def _get_messages_legacy(self, folder_name: str, limit: int, body_chars: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Legacy message loading method (synchronous fallback).
+        body_chars truncates body_content per message as it is read (None keeps full bodies)."""
         try:
             # Get folder
             if folder_name.lower() == "inbox":
@@ -155,6 +184,8 @@ class OutlookCOMConnector:
                     logger.info(f"Processing item {processed}: {getattr(item, 'Subject', 'No Subject')[:50]}")
                     message_data = self._extract_message_data(item)
                     if message_data:
+                        if body_chars is not None and message_data.get('body_content'):
+                            message_data['body_content'] = message_data['body_content'][:body_chars]
                         messages.append(message_data)
                         count += 1
                     else:
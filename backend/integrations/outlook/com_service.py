@@ -6,6 +6,7 @@ import logging
 from typing import Dict, List, Optional, Any
 import asyncio
 import json
+import time
 from datetime import datetime
 
 from .com_connector import OutlookCOMConnector, COM_AVAILABLE
@@ -22,6 +23,13 @@ class OutlookCOMService:
         self._connected = False
         self._connection_method = None
         
+        # Cached result of is_connected() for per-message callers
+        self._com_last_check = 0.0
+        self._com_ok = False
+        
+        # (parent, folder) pairs already confirmed to exist this process
+        self._ready_folders = set()
+        
         # Will be injected by email_triage agent
         self.intelligence_service = None
         
@@ -49,6 +57,8 @@ class OutlookCOMService:
         if self.com_connector.connect():
             self._connected = True
             self._connection_method = "com"
+            self._com_ok = True
+            self._com_last_check = time.monotonic()
             account_info = self.com_connector.get_account_info()
             
             logger.info("✅ Connected to Outlook via COM")
@@ -71,6 +81,34 @@ class OutlookCOMService:
         """Check if connected to Outlook"""
         return self._connected and self.com_connector and self.com_connector.is_connected()
     
+    def is_connected_cached(self, ttl: float = 2.0) -> bool:
+        """Return the last connection probe result, re-probing only when older than ttl seconds"""
+        now = time.monotonic()
+        if now - self._com_last_check > ttl:
+            self._com_ok = bool(self.is_connected())
+            self._com_last_check = now
+        return self._com_ok
+    
+    def ensure_connected(self, ttl: float = 5.0) -> Dict[str, Any]:
+        """Connect unless a probe within the last ttl seconds found the connection up.
+        Returns a connect()-style result dict."""
+        if self.is_connected_cached(ttl):
+            return {
+                "connected": True,
+                "method": self._connection_method,
+                "message": "Already connected",
+            }
+        return self.connect()
+    
+    def reset_connection(self):
+        """Treat the connection as lost after a COM failure, so the next ensure_connected()
+        reconnects (fresh Outlook proxies) instead of trusting the connected flags"""
+        self._connected = False
+        self._com_ok = False
+        self._com_last_check = 0.0
+        if self.com_connector:
+            self.com_connector.mark_disconnected()
+    
     def get_connection_info(self) -> Dict[str, Any]:
         """Get current connection information"""
         if not self.is_connected():
@@ -82,10 +120,11 @@ class OutlookCOMService:
             "account_info": self.com_connector.get_account_info() if self.com_connector else None
         }
     
-    def get_recent_emails(self, folder_name: str = "Inbox", limit: int = 10) -> List[Dict[str, Any]]:
+    def get_recent_emails(self, folder_name: str = "Inbox", limit: int = 10, body_chars: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get recent emails using ONLY the legacy COM method.
         This ensures COS properties are properly loaded.
+        body_chars truncates each body_content at load time (None keeps full bodies).
         """
         if not self.is_connected():
             logger.error("Not connected to Outlook - call connect() first")
@@ -95,7 +134,7 @@ class OutlookCOMService:
             logger.info(f"📧 Loading {limit} emails from {folder_name} using COM legacy method")
             
             # ONLY use legacy method - this is critical for COS property loading
-            emails = self.com_connector._get_messages_legacy(folder_name, limit)
+            emails = self.com_connector._get_messages_legacy(folder_name, limit, body_chars)
             
             if emails:
                 logger.info(f"✅ Successfully loaded {len(emails)} emails with COS properties")
@@ -117,17 +156,18 @@ class OutlookCOMService:
             logger.error(f"❌ Failed to load emails: {e}")
             return []
     
-    def get_recent_emails_without_analysis(self, folder_name: str = "Inbox", limit: int = 10) -> List[Dict[str, Any]]:
+    def get_recent_emails_without_analysis(self, folder_name: str = "Inbox", limit: int = 10, body_chars: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Load emails WITHOUT automatic AI analysis.
         Only loads existing COS properties from Outlook. Analysis is on-demand only.
+        body_chars truncates each body_content at load time (None keeps full bodies).
         """
         if not self.is_connected():
             logger.error("Not connected to Outlook")
             return []
             
         # Get emails using COM legacy method - this loads existing COS properties only
-        emails = self.get_recent_emails(folder_name, limit)
+        emails = self.get_recent_emails(folder_name, limit, body_chars)
         
         if not emails:
             return []
@@ -347,6 +387,20 @@ class OutlookCOMService:
             logger.error(f"Failed to create folder: {e}")
             return False
     
+    def ensure_folder(self, folder_name: str, parent_folder: str = "Inbox") -> bool:
+        """Create a folder once per process; later calls skip the Outlook round-trip"""
+        key = (parent_folder, folder_name)
+        if key in self._ready_folders:
+            return True
+        if self.create_folder(folder_name, parent_folder):
+            self._ready_folders.add(key)
+            return True
+        return False
+    
+    def forget_folder(self, folder_name: str, parent_folder: str = "Inbox"):
+        """Drop a folder from the ensure_folder cache, e.g. after it was deleted in Outlook"""
+        self._ready_folders.discard((parent_folder, folder_name))
+    
     def setup_gtd_folders(self) -> Dict[str, bool]:
         """Set up GTD-style folders for Chief of Staff"""
         if not self.is_connected():
@@ -5,9 +5,9 @@ Note: Emails are accessed directly from Outlook COM integration, not stored in d
 """
 from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
-from sqlalchemy import Column, String, DateTime, Date, Time, Text, Integer, Float, Boolean, ForeignKey, JSON, Index
+from sqlalchemy import Column, String, DateTime, Date, Time, Text, Integer, Float, Boolean, ForeignKey, JSON, Index, event, inspect, update
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, Session
 from sqlalchemy.dialects.sqlite import JSON as SQLiteJSON
 import uuid
 
@@ -58,6 +58,10 @@ class Project(Base):
     sort_order = Column(Integer, default=0, index=True)
     color = Column(String)  # Hex color, defaults to area color if not set
     
+    # Denormalized task counters, kept in step by _track_project_task_counts
+    task_count = Column(Integer, default=0, nullable=False)
+    completed_task_count = Column(Integer, default=0, nullable=False)
+    
     created_at = Column(DateTime, default=utc_now)
     updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
     
@@ -72,6 +76,7 @@ class Project(Base):
     __table_args__ = (
         Index('idx_project_area_status', 'area_id', 'status'),
         Index('idx_project_catch_all', 'is_catch_all', 'area_id'),
+        Index('idx_projects_area_sort', 'area_id', 'sort_order'),
     )
     
     def __repr__(self):
@@ -101,6 +106,11 @@ class Task(Base):
     parent_task = relationship("Task", remote_side=[id])
     subtasks = relationship("Task", cascade="all, delete-orphan", overlaps="parent_task")
     
+    __table_args__ = (
+        Index('idx_tasks_project_status', 'project_id', 'status'),
+        Index('idx_tasks_project_due', 'project_id', 'due_date'),
+    )
+    
     # Convenience properties
     @property
     def area_id(self) -> Optional[str]:
@@ -115,6 +125,57 @@ class Task(Base):
     def __repr__(self):
         return f"<Task(title='{self.title}', project='{self.project.name if self.project else None}', status='{self.status}')>"
 
+def adjust_project_task_counts(connection, project_id: Optional[str], total: int = 0, completed: int = 0):
+    """Apply a delta to a project's denormalized task counters"""
+    if not project_id or (total == 0 and completed == 0):
+        return
+    projects = Project.__table__
+    connection.execute(
+        update(projects)
+        .where(projects.c.id == project_id)
+        .values(
+            task_count=projects.c.task_count + total,
+            completed_task_count=projects.c.completed_task_count + completed,
+            updated_at=projects.c.updated_at  # counter bumps are not project edits
+        )
+    )
+
+@event.listens_for(Session, "after_flush")
+def _track_project_task_counts(session, flush_context):
+    """Keep Project task counters in step with Task inserts, deletes and status/project moves"""
+    deltas: Dict[str, List[int]] = {}
+
+    def bump(project_id, status, sign):
+        counts = deltas.setdefault(project_id, [0, 0])
+        counts[0] += sign
+        if status == "completed":
+            counts[1] += sign
+
+    # new/deleted/dirty and attribute history still reflect the pre-flush state here
+    for obj in session.new:
+        if isinstance(obj, Task):
+            bump(obj.project_id, obj.status, 1)
+    for obj in session.deleted:
+        if isinstance(obj, Task):
+            bump(obj.project_id, obj.status, -1)
+    for obj in session.dirty:
+        if not isinstance(obj, Task):
+            continue
+        state = inspect(obj)
+        status_history = state.attrs.status.history
+        project_history = state.attrs.project_id.history
+        if not (status_history.has_changes() or project_history.has_changes()):
+            continue
+        old_status = status_history.deleted[0] if status_history.deleted else obj.status
+        old_project_id = project_history.deleted[0] if project_history.deleted else obj.project_id
+        bump(old_project_id, old_status, -1)
+        bump(obj.project_id, obj.status, 1)
+
+    if deltas:
+        connection = session.connection()
+        for project_id, (total, completed) in deltas.items():
+            adjust_project_task_counts(connection, project_id, total, completed)
+
 # Email model removed - emails are accessed directly from Outlook, not stored in database
 
 class ContextEntry(Base):
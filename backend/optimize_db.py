@@ -37,6 +37,7 @@ def optimize_database(db_path: str = "./cos.db"):
             # Projects table indexes
             "CREATE INDEX IF NOT EXISTS idx_projects_status ON projects(status)",
             "CREATE INDEX IF NOT EXISTS idx_projects_created ON projects(created_at)",
+            "CREATE INDEX IF NOT EXISTS idx_projects_area_sort ON projects(area_id, sort_order)",
             
             # Tasks table indexes  
             "CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status)",
@@ -44,6 +45,7 @@ def optimize_database(db_path: str = "./cos.db"):
             "CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks(due_date)",
             "CREATE INDEX IF NOT EXISTS idx_tasks_created ON tasks(created_at)",
             "CREATE INDEX IF NOT EXISTS idx_tasks_project_status ON tasks(project_id, status)",
+            "CREATE INDEX IF NOT EXISTS idx_tasks_project_due ON tasks(project_id, due_date)",
             
             # Emails table indexes
             "CREATE INDEX IF NOT EXISTS idx_emails_status ON emails(status)",
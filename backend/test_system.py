@@ -282,6 +282,56 @@ class SystemTest:
             
         return True
     
+    def test_dashboard_cache_revision(self):
+        """Test that a write committed on another connection invalidates the dashboard cache"""
+        print("\n" + "="*60)
+        print("7. TESTING DASHBOARD CACHE INVALIDATION")
+        print("="*60)
+        
+        try:
+            import app
+            from sqlalchemy import create_engine
+            from sqlalchemy.orm import sessionmaker
+            from models import Base, Area
+            
+            # Separate pooled engines, so the check and the write can't share a connection
+            check_engine = create_engine("sqlite:///./test_revision.db")
+            write_engine = create_engine("sqlite:///./test_revision.db")
+            Base.metadata.create_all(bind=check_engine)
+            check_db = sessionmaker(bind=check_engine)()
+            write_db = sessionmaker(bind=write_engine)()
+            
+            # Dashboard "built" while the checking connection is in use
+            check_db.query(Area).all()
+            app.dashboard_cache["version"] = app.db_revision
+            app.dashboard_cache["built_at"] = time.monotonic()
+            fresh_before = app.dashboard_cache_fresh(app.db_revision)
+            
+            write_db.add(Area(name="Revision Test Area"))
+            write_db.commit()
+            separate = check_db.connection().connection.dbapi_connection is not write_db.connection().connection.dbapi_connection
+            stale_after = not app.dashboard_cache_fresh(app.db_revision)
+            
+            check_db.close()
+            write_db.close()
+            check_engine.dispose()
+            write_engine.dispose()
+            app.dashboard_cache["version"] = None
+            
+            success = fresh_before and separate and stale_after
+            self.log_test("Dashboard cache invalidation", success,
+                          "Cross-connection write marks cache stale" if success
+                          else f"fresh_before={fresh_before}, separate={separate}, stale_after={stale_after}")
+            
+            # Cleanup
+            os.unlink("./test_revision.db")
+            
+        except Exception as e:
+            self.log_test("Dashboard cache invalidation", False, f"Failed: {e}")
+            return False
+            
+        return success
+    
     def print_summary(self):
         """Print test summary"""
         print("\n" + "="*60)
@@ -325,6 +375,7 @@ async def run_all_tests():
     success &= test.test_com_integration()
     success &= await test.test_agents()
     success &= test.test_job_queue()
+    success &= test.test_dashboard_cache_revision()
     
     # Print final summary
     overall_success = test.print_summary()
@@ -5,6 +5,12 @@ All times are stored in UTC and converted to local time on the frontend.
 from datetime import datetime, timezone
 from typing import Optional
 
+try:
+    import ciso8601
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+
 def utc_now() -> datetime:
     """Return current UTC time in timezone-aware format"""
     return datetime.now(timezone.utc)
@@ -13,17 +19,23 @@ def utc_timestamp() -> str:
     """Return current UTC timestamp as ISO string"""
     return utc_now().isoformat()
 
+def parse_iso_datetime(dt_string: str) -> datetime:
+    """Parse ISO 8601 string (including 'Z' suffix), raising ValueError if invalid"""
+    if CISO8601_AVAILABLE:
+        return ciso8601.parse_datetime(dt_string)
+    
+    # Handle both with and without timezone info
+    if dt_string.endswith('Z'):
+        dt_string = dt_string[:-1] + '+00:00'
+    return datetime.fromisoformat(dt_string)
+
 def parse_datetime(dt_string: Optional[str]) -> Optional[datetime]:
     """Parse ISO datetime string to timezone-aware datetime object"""
     if not dt_string:
         return None
     
     try:
-        # Handle both with and without timezone info
-        if dt_string.endswith('Z'):
-            dt_string = dt_string[:-1] + '+00:00'
-        
-        dt = datetime.fromisoformat(dt_string)
+        dt = parse_iso_datetime(dt_string)
         
         # If naive datetime, assume UTC
         if dt.tzinfo is None:
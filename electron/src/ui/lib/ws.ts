@@ -1,5 +1,7 @@
 export type Listener = (data: any) => void;
 
+const frameEncoder = new TextEncoder();
+
 class WSManager {
   private listeners = new Map<string, Set<Listener>>();
   private socket: WebSocket | null = null;
@@ -30,17 +32,20 @@ class WSManager {
       
       this.socket.onmessage = (ev) => {
         try {
-          const msg = JSON.parse(ev.data);
-          if (msg?.event) {
-            const eventListeners = this.listeners.get(msg.event);
-            if (eventListeners) {
-              eventListeners.forEach(fn => {
-                try {
-                  fn(msg.data);
-                } catch (error) {
-                  console.error('Error in event listener:', error);
-                }
-              });
+          const parsed = JSON.parse(ev.data);
+          // Several messages may arrive coalesced into one frame as a JSON array
+          for (const msg of (Array.isArray(parsed) ? parsed : [parsed])) {
+            if (msg?.event) {
+              const eventListeners = this.listeners.get(msg.event);
+              if (eventListeners) {
+                eventListeners.forEach(fn => {
+                  try {
+                    fn(msg.data);
+                  } catch (error) {
+                    console.error('Error in event listener:', error);
+                  }
+                });
+              }
             }
           }
         } catch (error) {
@@ -100,7 +105,8 @@ class WSManager {
   send(event: string, data: any): boolean {
     if (this.socket?.readyState === WebSocket.OPEN) {
       try {
-        this.socket.send(JSON.stringify({ event, data }));
+        // Binary frame: the server decodes it with orjson and skips text-frame UTF-8 validation
+        this.socket.send(frameEncoder.encode(JSON.stringify({ event, data })));
         return true;
       } catch (error) {
         console.error('Error sending WebSocket message:', error);
@@ -17,7 +17,7 @@ if not exist "backend\app.py" (
 python --version >nul 2>&1
 if %errorlevel% neq 0 (
     echo ERROR: Python is not installed or not in PATH
-    echo Please install Python 3.8+ from python.org and try again
+    echo Please install Python 3.9+ from python.org and try again
     pause
     exit /b 1
 )